@@ -103,7 +103,7 @@ def main():
                 print(f"\n📄 Extracted text:\n{text[:200]}...\n")
 
                 # Extract card info
-                card_info = ocr.extract_pokemon_info(text)
+                card_info = ocr.extract_pokemon_info(text, fields=('name',))
                 card_name = card_info.get('name')
 
                 if not card_name:
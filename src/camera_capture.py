@@ -12,6 +12,12 @@ from PIL import Image
 class CameraCapture:
     """Handles camera operations for card scanning"""
 
+    # Kernels shared by the preprocessing steps
+    SHARPEN_KERNEL = np.array([[-1, -1, -1],
+                               [-1,  9, -1],
+                               [-1, -1, -1]])
+    DILATE_KERNEL = np.ones((2, 2), np.uint8)
+
     def __init__(self, camera_index: int = 0):
         """
         Initialize camera capture
@@ -22,6 +28,7 @@ class CameraCapture:
         self.camera_index = camera_index
         self.cap = None
         self.is_running = False
+        self.buffer_size = None  # OpenCV capture queue length (None = driver default)
 
     @staticmethod
     def list_available_cameras(max_test: int = 10) -> List[int]:
@@ -85,6 +92,9 @@ class CameraCapture:
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
             self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
 
+            if self.buffer_size is not None:
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+
             self.is_running = True
             print("✓ Camera started successfully")
             return True
@@ -92,6 +102,25 @@ class CameraCapture:
             print(f"Error starting camera: {e}")
             return False
 
+    def set_buffer_size(self, size: int) -> bool:
+        """
+        Set how many frames OpenCV queues internally
+
+        A size of 1 keeps read_frame() returning the freshest frame instead
+        of one that has been sitting in the driver queue. The value is kept
+        and reapplied when the camera is restarted or switched.
+
+        Args:
+            size: Number of frames to buffer
+
+        Returns:
+            True if the backend accepted the setting (or camera not started)
+        """
+        self.buffer_size = size
+        if not self.cap or not self.cap.isOpened():
+            return True
+        return bool(self.cap.set(cv2.CAP_PROP_BUFFERSIZE, size))
+
     def stop(self):
         """Stop the camera capture and release resources"""
         if self.cap:
@@ -149,20 +178,16 @@ class CameraCapture:
         # Apply bilateral filter to preserve edges while smoothing
         bilateral = cv2.bilateralFilter(denoised, 9, 75, 75)
 
-        # Sharpen the image
-        kernel_sharpen = np.array([[-1, -1, -1],
-                                   [-1,  9, -1],
-                                   [-1, -1, -1]])
-        sharpened = cv2.filter2D(bilateral, -1, kernel_sharpen)
+        # Sharpen, threshold and dilate in place on the bilateral output buffer
+        buf = cv2.filter2D(bilateral, -1, self.SHARPEN_KERNEL, dst=bilateral)
 
         # Apply Otsu's thresholding for better text separation
-        _, thresh = cv2.threshold(sharpened, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        cv2.threshold(buf, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=buf)
 
         # Dilate slightly to make text thicker and more readable
-        kernel = np.ones((2, 2), np.uint8)
-        dilated = cv2.dilate(thresh, kernel, iterations=1)
+        cv2.dilate(buf, self.DILATE_KERNEL, dst=buf, iterations=1)
 
-        return dilated
+        return buf
 
     def detect_card_region(self, image: np.ndarray) -> Optional[np.ndarray]:
         """
@@ -246,17 +271,14 @@ class CameraCapture:
         lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
         l, a, b = cv2.split(lab)
         clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
-        l = clahe.apply(l)
-        enhanced = cv2.merge([l, a, b])
-        enhanced = cv2.cvtColor(enhanced, cv2.COLOR_LAB2BGR)
+        clahe.apply(l, dst=l)
+        cv2.merge([l, a, b], dst=lab)
+        enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
 
-        # Sharpen
-        kernel = np.array([[-1, -1, -1],
-                          [-1,  9, -1],
-                          [-1, -1, -1]])
-        sharpened = cv2.filter2D(enhanced, -1, kernel)
+        # Sharpen in place
+        cv2.filter2D(enhanced, -1, self.SHARPEN_KERNEL, dst=enhanced)
 
-        return sharpened
+        return enhanced
 
     def save_image(self, image: np.ndarray, filepath: str) -> bool:
         """
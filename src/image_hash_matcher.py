@@ -6,7 +6,6 @@ Inspired by NolanAmblard/Pokemon-Card-Scanner and pokemon-card-recognizer
 
 import os
 import sqlite3
-import requests
 import numpy as np
 import cv2
 from PIL import Image
@@ -14,21 +13,41 @@ from io import BytesIO
 from typing import List, Tuple, Optional, Dict
 import imagehash
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tcg_api import TCGAPIClient
 
+# Concurrent image downloads while building the hash database
+DOWNLOAD_WORKERS = 8
+
 
 class ImageHashMatcher:
     """Matches cards using perceptual image hashing"""
 
-    def __init__(self, db_path: str = "card_data/image_hashes.db"):
+    # Supported matching algorithms:
+    #   'phash' - perceptual hash only (fast, stable; recommended threshold 6-8)
+    #   'all'   - minimum distance across average/perceptual/difference/wavelet hashes
+    HASH_ALGOS = ('phash', 'all')
+
+    def __init__(self, db_path: str = "card_data/image_hashes.db",
+                 hash_algo: str = 'all', threshold: int = 15,
+                 api: Optional[TCGAPIClient] = None):
         """
         Initialize the image hash matcher
 
         Args:
             db_path: Path to SQLite database for storing hashes
+            hash_algo: Default matching algorithm ('phash' or 'all')
+            threshold: Default maximum hash distance for a match
+            api: Optional shared API client (its pooled session is also used
+                 for image downloads)
         """
+        if hash_algo not in self.HASH_ALGOS:
+            raise ValueError(f"Unknown hash algorithm: {hash_algo}")
+
         self.db_path = db_path
-        self.api = TCGAPIClient()
+        self.hash_algo = hash_algo
+        self.threshold = threshold
+        self.api = api if api is not None else TCGAPIClient()
         self.lock = threading.Lock()
 
         # Create database directory if it doesn't exist
@@ -123,23 +142,26 @@ class ImageHashMatcher:
 
             print(f"[ImageHash] Total cards to process: {len(all_cards)}")
 
-            # Download and hash each card
+            # Download and hash cards concurrently (network latency dominates);
+            # progress is reported from this thread as each card finishes
             downloaded = 0
-            for idx, card in enumerate(all_cards, 1):
-                try:
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+                futures = {pool.submit(self._download_and_hash_card, card): card
+                           for card in all_cards}
+                for idx, future in enumerate(as_completed(futures), 1):
+                    card = futures[future]
+                    try:
+                        if future.result():
+                            downloaded += 1
+                    except Exception as e:
+                        print(f"[ImageHash] Error processing card {card.get('name', 'Unknown')}: {e}")
+
                     if callback:
                         callback(idx, len(all_cards), card.get('name', 'Unknown'))
 
-                    if self._download_and_hash_card(card):
-                        downloaded += 1
-
                     if idx % 100 == 0:
                         print(f"[ImageHash] Progress: {idx}/{len(all_cards)} cards processed")
 
-                except Exception as e:
-                    print(f"[ImageHash] Error processing card {card.get('name', 'Unknown')}: {e}")
-                    continue
-
             print(f"[ImageHash] ✓ Downloaded and hashed {downloaded} cards")
             return downloaded
 
@@ -176,8 +198,8 @@ class ImageHashMatcher:
                     if cursor.fetchone():
                         return True  # Already have this card
 
-            # Download image
-            response = requests.get(image_url, timeout=10)
+            # Download image (keep-alive connection from the API client's pool)
+            response = self.api.session.get(image_url, timeout=10)
             response.raise_for_status()
 
             # Load image
@@ -263,17 +285,26 @@ class ImageHashMatcher:
 
         return hashes
 
-    def match_card_image(self, image: np.ndarray, threshold: int = 15) -> Optional[Dict]:
+    def match_card_image(self, image: np.ndarray, threshold: Optional[int] = None,
+                         algo: Optional[str] = None) -> Optional[Dict]:
         """
         Match a captured card image against the hash database
 
         Args:
             image: Card image as numpy array (from camera/OCR)
-            threshold: Maximum hash distance for a match (lower = more strict)
+            threshold: Maximum hash distance for a match (lower = more strict);
+                defaults to the matcher's configured threshold
+            algo: Matching algorithm ('phash' or 'all'); defaults to the
+                matcher's configured algorithm
 
         Returns:
             Dictionary with matched card info and confidence, or None if no match
         """
+        if threshold is None:
+            threshold = self.threshold
+        if algo is None:
+            algo = self.hash_algo
+
         try:
             # Convert numpy array to PIL Image
             if isinstance(image, np.ndarray):
@@ -289,8 +320,24 @@ class ImageHashMatcher:
             else:
                 pil_image = image
 
-            # Compute hashes for the captured image
-            captured_hashes = self._compute_all_hashes(pil_image)
+            if algo == 'phash':
+                # Only the perceptual hash of the capture is needed; the stored
+                # rotated hashes cover orientation
+                captured_hashes = {'p_hash': imagehash.phash(pil_image)}
+                columns = {'p_hash': (7, 8, 9, 10)}
+                query = ('SELECT id, name, set_name, set_code, number, rarity, image_url, '
+                         'perceptual_hash, phash_90, phash_180, phash_270 '
+                         'FROM card_hashes WHERE downloaded = 1')
+            else:
+                # Compute hashes for the captured image
+                captured_hashes = self._compute_all_hashes(pil_image)
+                columns = {
+                    'avg_hash': (7, 11, 12, 13),  # average_hash + rotations
+                    'p_hash': (8, 14, 15, 16),  # perceptual_hash + rotations
+                    'd_hash': (9,),  # difference_hash
+                    'w_hash': (10,),  # wavelet_hash
+                }
+                query = 'SELECT * FROM card_hashes WHERE downloaded = 1'
 
             # Search database for matches
             best_match = None
@@ -298,39 +345,16 @@ class ImageHashMatcher:
 
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM card_hashes WHERE downloaded = 1')
+                cursor.execute(query)
 
                 for row in cursor.fetchall():
-                    # Calculate distances for all hash types
+                    # Calculate distances for all hash types (including rotations)
                     distances = []
-
-                    # Average hash distances (including rotations)
-                    if row[7]:  # average_hash
-                        distances.append(captured_hashes['avg_hash'] - imagehash.hex_to_hash(row[7]))
-                    if row[11]:  # avg_hash_90
-                        distances.append(captured_hashes['avg_hash'] - imagehash.hex_to_hash(row[11]))
-                    if row[12]:  # avg_hash_180
-                        distances.append(captured_hashes['avg_hash'] - imagehash.hex_to_hash(row[12]))
-                    if row[13]:  # avg_hash_270
-                        distances.append(captured_hashes['avg_hash'] - imagehash.hex_to_hash(row[13]))
-
-                    # Perceptual hash distances (including rotations)
-                    if row[8]:  # perceptual_hash
-                        distances.append(captured_hashes['p_hash'] - imagehash.hex_to_hash(row[8]))
-                    if row[14]:  # phash_90
-                        distances.append(captured_hashes['p_hash'] - imagehash.hex_to_hash(row[14]))
-                    if row[15]:  # phash_180
-                        distances.append(captured_hashes['p_hash'] - imagehash.hex_to_hash(row[15]))
-                    if row[16]:  # phash_270
-                        distances.append(captured_hashes['p_hash'] - imagehash.hex_to_hash(row[16]))
-
-                    # Difference hash
-                    if row[9]:  # difference_hash
-                        distances.append(captured_hashes['d_hash'] - imagehash.hex_to_hash(row[9]))
-
-                    # Wavelet hash
-                    if row[10]:  # wavelet_hash
-                        distances.append(captured_hashes['w_hash'] - imagehash.hex_to_hash(row[10]))
+                    for hash_key, indices in columns.items():
+                        captured = captured_hashes[hash_key]
+                        for idx in indices:
+                            if row[idx]:
+                                distances.append(captured - imagehash.hex_to_hash(row[idx]))
 
                     # Take the minimum distance (best match across all hash types and rotations)
                     if distances:
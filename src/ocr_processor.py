@@ -4,18 +4,264 @@ Handles text extraction from Pokemon card images using Tesseract OCR
 """
 
 import re
+import string
 import os
 import platform
+import functools
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from array import array
+from collections import OrderedDict
 import pytesseract
 from PIL import Image
 import numpy as np
 import cv2
 from typing import List, Dict, Optional, Tuple
 
+# Optional: tesserocr keeps Tesseract loaded in-process instead of spawning
+# a subprocess per call. Falls back to pytesseract when not installed.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Optional: rapidfuzz scores fuzzy name matches in C++. Falls back to the
+# pure-Python word-overlap matcher when not installed.
+try:
+    from rapidfuzz import process as fuzz_process, utils as fuzz_utils
+    from rapidfuzz.distance import Indel
+except ImportError:
+    fuzz_process = None
+
+# Characters Tesseract is allowed to emit for card text
+TESSERACT_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789- '
+
+# Page segmentation modes tried by extract_text; ties go to the earlier mode
+# PSM 11: Sparse text. Find as much text as possible in no particular order
+# PSM 6: Assume a single uniform block of text
+# PSM 3: Fully automatic page segmentation
+OCR_PSM_MODES = (11, 6, 3)
+
+# PSM 3 runs first on its own; the other modes only run when it finds
+# fewer than OCR_MIN_TEXT_LENGTH characters of confident text
+OCR_PRIMARY_PSM = 3
+OCR_MIN_TEXT_LENGTH = 20
+
+# Number of OCR results kept, keyed by a hash of the preprocessed image
+OCR_CACHE_SIZE = 256
+
+# Card edges are searched for on a copy no larger than this on its long edge
+CONTOUR_MAX_DIM = 800
+
+# Words Tesseract is less confident about than this (0-100) are dropped
+OCR_MIN_CONFIDENCE = 60
+
+# Precompiled patterns (card text is ASCII, so skip Unicode class tables)
+_CLEAN_LINE_RE = re.compile(r'[^a-zA-Z0-9\s\-\'\.]', re.ASCII)
+_CLEAN_WORD_RE = re.compile(r'[^a-zA-Z0-9\s\-\']', re.ASCII)
+_CLEAN_CAP_WORD_RE = re.compile(r'[^a-zA-Z0-9\-\']', re.ASCII)
+_HP_RE = re.compile(r'HP\s*(\d+)', re.IGNORECASE | re.ASCII)
+_WS_RE = re.compile(r'\s+')
+_JUNK_RE = re.compile(r'[|@#$%^&*()_+=\[\]{};:<>?/\\]')
+_SETNUM_RE = re.compile(r'(\d+)\s*/\s*(\d+)', re.ASCII)
+
+# Deletes ASCII letters, so len(s) - len(s.translate(...)) counts them in C
+_STRIP_LETTERS = str.maketrans('', '', string.ascii_letters)
+
+# Keywords recognised by extract_type / extract_rarity, in priority order
+POKEMON_TYPES = (
+    'Grass', 'Fire', 'Water', 'Lightning', 'Psychic',
+    'Fighting', 'Darkness', 'Metal', 'Dragon', 'Fairy',
+    'Colorless'
+)
+CARD_RARITIES = (
+    'Common', 'Uncommon', 'Rare', 'Rare Holo', 'Rare Ultra',
+    'Rare Secret', 'Promo', 'Amazing Rare', 'Rare Rainbow'
+)
+
+
+def _build_keyword_scanner():
+    """
+    Build a single-pass scanner for all type and rarity keywords
+
+    The lookahead lets matches overlap, so every keyword occurrence is seen
+    even when a longer keyword starts at the same position. Each keyword
+    maps to every (kind, priority) it implies, including shorter keywords
+    it contains ("rare holo" also implies "rare").
+
+    Returns:
+        Tuple of (compiled pattern, keyword -> list of (kind, priority))
+    """
+    groups = (('type', POKEMON_TYPES), ('rarity', CARD_RARITIES))
+    keywords = {word.lower() for _, words in groups for word in words}
+    hits = {
+        kw: [(kind, i) for kind, words in groups
+             for i, word in enumerate(words) if word.lower() in kw]
+        for kw in keywords
+    }
+    alternation = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))'), hits
+
+
+_KEYWORD_RE, _KEYWORD_HITS = _build_keyword_scanner()
+
+
+def _alpha_ratio(text: str) -> float:
+    """Fraction of characters in already-cleaned (ASCII) text that are letters"""
+    if not text:
+        return 0
+    return (len(text) - len(text.translate(_STRIP_LETTERS))) / len(text)
+
+
+# OCR text extraction is a pure function of the text, and the same text
+# comes back often (re-scans of a still card, the correction dialog), so
+# the parsers below are memoised at module level.
+@functools.lru_cache(maxsize=1024)
+def _extract_card_name(text: str) -> Tuple[Optional[str], int]:
+    """
+    Pick the most likely card name out of OCR text
+
+    Args:
+        text: OCR extracted text
+
+    Returns:
+        Tuple of (best name or None, number of candidates considered)
+    """
+    # Only the first 10 lines are inspected line-by-line, so stop splitting there
+    lines = text.strip().split('\n', 10)[:10]
+
+    # Try multiple strategies to extract the card name. A candidate from an
+    # earlier strategy always beats any from a later one, so each strategy
+    # only runs if the previous ones found nothing; within a strategy the
+    # best is kept as we go: highest alpha_ratio, then longest, then first seen
+    best_name = None
+    best_key = None
+    num_candidates = 0
+
+    # Strategy 1: First meaningful line (most common)
+    for line in lines[:7]:  # Check first 7 lines
+        line = line.strip()
+        # Remove common OCR artifacts
+        cleaned = _CLEAN_LINE_RE.sub('', line)
+        cleaned = cleaned.strip()
+
+        # Card name should be at least 2 characters (more lenient)
+        if len(cleaned) >= 2:
+            # Check if it's mostly alphabetic (card names)
+            alpha_ratio = _alpha_ratio(cleaned)
+            if alpha_ratio > 0.4:  # Lower threshold - was 0.5
+                num_candidates += 1
+                key = (-alpha_ratio, -len(cleaned))
+                if best_key is None or key < best_key:
+                    best_name, best_key = cleaned, key
+
+    if best_name is not None:
+        return best_name, num_candidates
+
+    # Strategy 2: Longest alphabetic sequence
+    for word in text.split():
+        cleaned = _CLEAN_WORD_RE.sub('', word).strip()
+        if len(cleaned) >= 3:
+            alpha_ratio = _alpha_ratio(cleaned)
+            if alpha_ratio > 0.6:
+                num_candidates += 1
+                key = (-alpha_ratio, -len(cleaned))
+                if best_key is None or key < best_key:
+                    best_name, best_key = cleaned, key
+
+    if best_name is not None:
+        return best_name, num_candidates
+
+    # Strategy 3: Look for capitalized words (Pokemon names are often capitalized)
+    for line in lines:
+        words = line.split()
+        for word in words:
+            if word and word[0].isupper() and len(word) >= 3:
+                cleaned = _CLEAN_CAP_WORD_RE.sub('', word).strip()
+                if len(cleaned) >= 3:
+                    num_candidates += 1
+                    key = (-_alpha_ratio(cleaned), -len(cleaned))
+                    if best_key is None or key < best_key:
+                        best_name, best_key = cleaned, key
+
+    return best_name, num_candidates
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_hp(text: str) -> Optional[str]:
+    """Return the digits following "HP" in OCR text, or None"""
+    match = _HP_RE.search(text)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_keywords(text_lower: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find Pokemon type and rarity in lowercased OCR text
+
+    Args:
+        text_lower: Lowercased OCR text
+
+    Returns:
+        Tuple of (type, rarity), each None if not found
+    """
+    best = {}
+    for match in _KEYWORD_RE.finditer(text_lower):
+        for kind, priority in _KEYWORD_HITS[match.group(1)]:
+            if kind not in best or priority < best[kind]:
+                best[kind] = priority
+
+    return (
+        POKEMON_TYPES[best['type']] if 'type' in best else None,
+        CARD_RARITIES[best['rarity']] if 'rarity' in best else None,
+    )
+
+
+def _bounded_lev(a: str, b: str, k: int) -> int:
+    """
+    Levenshtein distance that gives up once it is known to exceed k
+
+    Args:
+        a: First string
+        b: Second string
+        k: Largest distance of interest
+
+    Returns:
+        Edit distance, or k + 1 if it is greater than k
+    """
+    if abs(len(a) - len(b)) > k:
+        return k + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    prev = array('i', range(len(b) + 1))
+    cur = array('i', prev)
+    for i, ca in enumerate(a, 1):
+        cur[0] = i
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = prev[j - 1] if ca == cb else prev[j - 1] + 1
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if cur[j - 1] + 1 < cost:
+                cost = cur[j - 1] + 1
+            cur[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > k:
+            return k + 1
+        prev, cur = cur, prev
+
+    return prev[len(b)] if prev[len(b)] <= k else k + 1
+
 
 class OCRProcessor:
     """Processes images to extract text using OCR"""
 
+    # Structuring element for closing gaps in detected card edges
+    EDGE_KERNEL = np.ones((5, 5), np.uint8)
+
     def __init__(self):
         """Initialize the OCR processor"""
         # Auto-configure Tesseract path for Windows
@@ -39,6 +285,47 @@ class OCRProcessor:
                 print("  Please install from: https://github.com/UB-Mannheim/tesseract/wiki")
                 print(f"  Checked paths: {possible_paths}")
 
+        # Persistent in-process Tesseract APIs, one per PSM mode so passes can
+        # overlap (each API is not thread-safe, so each has its own lock)
+        self._tess_apis = {}
+        if tesserocr is not None:
+            try:
+                for psm in OCR_PSM_MODES:
+                    api = tesserocr.PyTessBaseAPI(psm=psm)
+                    api.SetVariable('tessedit_char_whitelist', TESSERACT_WHITELIST)
+                    self._tess_apis[psm] = (api, threading.Lock())
+                print("✓ Using in-process Tesseract (tesserocr)")
+            except Exception as e:
+                print(f"⚠ tesserocr unavailable ({e}), falling back to pytesseract")
+                for api, _ in self._tess_apis.values():
+                    api.End()
+                self._tess_apis = {}
+
+        # CUDA-enabled OpenCV builds run edge detection and the perspective
+        # warp on the GPU (the filter objects are shared, so guarded by a lock)
+        self._has_cuda = False
+        try:
+            self._has_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            pass
+        self._cuda_lock = threading.Lock()
+        if self._has_cuda:
+            self._cuda_blur = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (5, 5), 0)
+            self._cuda_canny = cv2.cuda.createCannyEdgeDetector(50, 200)
+            print("✓ Using CUDA for card edge detection")
+
+        # LRU of extract_text results for repeat scans of an identical image
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+
+        # Worker processes for multi-region OCR, created on first use
+        self._pool = None
+
+        # Fallback PSM passes run side by side (separate tesseract subprocesses
+        # under pytesseract, separate APIs under tesserocr)
+        self._psm_pool = ThreadPoolExecutor(max_workers=len(OCR_PSM_MODES) - 1,
+                                            thread_name_prefix='ocr-psm')
+
     def find_card_contour(self, image: np.ndarray) -> Tuple[Optional[np.ndarray], float]:
         """
         Find the largest rectangular contour in the image (card edges)
@@ -47,51 +334,79 @@ class OCRProcessor:
             image: Input image as numpy array
 
         Returns:
-            Tuple of (corners, area) or (None, 0) if not found
+            Tuple of (corners, area) or (None, 0) if not found, in the
+            coordinates of the full-size input image
         """
         try:
+            # Edge detection on a downscaled copy is just as reliable for a
+            # card-sized rectangle and touches far fewer pixels
+            scale = CONTOUR_MAX_DIM / max(image.shape[:2])
+            if scale < 1.0:
+                image = cv2.resize(image, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)
+            else:
+                scale = 1.0
+
             # Convert to grayscale
             if len(image.shape) == 3:
                 gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            elif scale < 1.0:
+                gray = image  # already a private downscaled copy
             else:
                 gray = image.copy()
 
-            # Apply Gaussian blur to reduce noise
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+            if self._has_cuda:
+                edges = self._cuda_edges(gray)
+            else:
+                # Apply Gaussian blur to reduce noise
+                # (in place: gray is always a fresh buffer owned by this call)
+                cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
 
-            # Canny edge detection
-            edges = cv2.Canny(blurred, 50, 200)
+                # Canny edge detection
+                edges = cv2.Canny(gray, 50, 200)
 
-            # Dilate and erode to clean up edges
-            kernel = np.ones((5, 5), np.uint8)
-            edges = cv2.dilate(edges, kernel, iterations=2)
-            edges = cv2.erode(edges, kernel, iterations=1)
+            # Close gaps in the edges, then thicken them once more (same net
+            # dilate bias as the old dilate x2 + erode x1), writing in place
+            cv2.morphologyEx(edges, cv2.MORPH_CLOSE, self.EDGE_KERNEL, dst=edges)
+            cv2.dilate(edges, self.EDGE_KERNEL, dst=edges)
 
             # Find contours
             contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-            # Find biggest rectangular contour
+            # Find biggest rectangular contour: filter small contours (at
+            # least 5000 full-size pixels), then try the rest largest first so
+            # polygon approximation stops at the first rectangle
+            min_area = 5000 * scale * scale
+            candidates = [(area, contour) for area, contour in
+                          zip(map(cv2.contourArea, contours), contours) if area > min_area]
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
             biggest_contour = None
             max_area = 0
 
-            for contour in contours:
-                area = cv2.contourArea(contour)
-
-                # Filter small contours (at least 5000 pixels)
-                if area > 5000:
-                    # Approximate contour to polygon
-                    perimeter = cv2.arcLength(contour, True)
-                    approx = cv2.approxPolyDP(contour, 0.02 * perimeter, True)
+            for area, contour in candidates:
+                # Approximate contour to polygon
+                perimeter = cv2.arcLength(contour, True)
+                approx = cv2.approxPolyDP(contour, 0.02 * perimeter, True)
 
-                    # Check if it's a rectangle (4 corners)
-                    if len(approx) == 4 and area > max_area:
-                        biggest_contour = approx
-                        max_area = area
+                # Check if it's a rectangle (4 corners)
+                if len(approx) == 4:
+                    biggest_contour = approx
+                    max_area = area
+                    break
 
             if biggest_contour is not None:
-                # Convert from shape (4, 1, 2) to (4, 2)
+                # Convert from shape (4, 1, 2) to (4, 2), back in full-size coordinates
                 corners = biggest_contour.reshape(4, 2)
-                return corners, max_area
+                if scale != 1.0:
+                    corners = corners.astype(np.float32) / scale
+
+                    # The dilation above pushed the outline out by the kernel
+                    # radius in downscaled pixels; pull the edges back in so
+                    # the outward bias matches a full-size pass
+                    radius = self.EDGE_KERNEL.shape[0] // 2
+                    corners = self._inset_corners(corners, radius * (1.0 / scale - 1.0))
+                return corners, max_area / (scale * scale)
 
             return None, 0
 
@@ -99,37 +414,83 @@ class OCRProcessor:
             print(f"[OCR] Error finding card contour: {e}")
             return None, 0
 
-    def reorder_corners(self, corners: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _inset_corners(corners: np.ndarray, distance: float) -> np.ndarray:
         """
-        Reorder corners to [top-left, top-right, bottom-left, bottom-right]
+        Move each edge of a quadrilateral inward by a fixed distance
 
         Args:
-            corners: Array of 4 corner points
+            corners: 4 corner points in contour order, shape (4, 2)
+            distance: How far to move each edge, in pixels
 
         Returns:
-            Reordered corners array
+            Corners of the inset quadrilateral, shape (4, 2) float32
         """
-        # Reshape if needed
-        if corners.shape == (4, 1, 2):
-            corners = corners.reshape(4, 2)
+        pts = corners.astype(np.float64)
+        centroid = pts.mean(axis=0)
+        nxt = np.roll(pts, -1, axis=0)
+
+        # Unit normal of each edge (pts[i] -> pts[i+1]), pointing at the centroid
+        direction = nxt - pts
+        normals = np.stack((-direction[:, 1], direction[:, 0]), axis=1)
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        flip = np.einsum('ij,ij->i', centroid - pts, normals) < 0
+        normals[flip] *= -1
+
+        # Shift every edge line, then intersect each pair of neighbouring lines
+        # (edge i-1 and edge i meet at corner i)
+        starts = pts + normals * distance
+        inset = np.empty_like(pts)
+        for i in range(4):
+            p, r = starts[i - 1], direction[i - 1]
+            q, t = starts[i], direction[i]
+            denom = r[0] * t[1] - r[1] * t[0]
+            if abs(denom) < 1e-9:
+                inset[i] = pts[i] + normals[i] * distance  # degenerate (parallel edges)
+            else:
+                u = ((q[0] - p[0]) * t[1] - (q[1] - p[1]) * t[0]) / denom
+                inset[i] = p + r * u
+        return inset.astype(np.float32)
 
-        # Initialize ordered points
-        ordered = np.zeros((4, 2), dtype=np.float32)
+    def _cuda_edges(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Gaussian blur + Canny on the GPU, keeping the data on the device between steps
 
-        # Sum and difference of coordinates
-        s = corners.sum(axis=1)
-        diff = np.diff(corners, axis=1)
+        Args:
+            gray: Grayscale image
+
+        Returns:
+            Edge map, downloaded back to host memory
+        """
+        with self._cuda_lock:
+            gpu_image = cv2.cuda_GpuMat()
+            gpu_image.upload(gray)
+            blurred = self._cuda_blur.apply(gpu_image)
+            return self._cuda_canny.detect(blurred).download()
+
+    def reorder_corners(self, corners: np.ndarray) -> np.ndarray:
+        """
+        Reorder corners to [top-left, top-right, bottom-left, bottom-right]
 
-        # Top-left has smallest sum
-        ordered[0] = corners[np.argmin(s)]
-        # Bottom-right has largest sum
-        ordered[3] = corners[np.argmax(s)]
-        # Top-right has smallest difference
-        ordered[1] = corners[np.argmin(diff)]
-        # Bottom-left has largest difference
-        ordered[2] = corners[np.argmax(diff)]
+        Args:
+            corners: Array of 4 corner points
 
-        return ordered
+        Returns:
+            Reordered corners array
+        """
+        # Four points: plain Python scalars beat a dozen tiny NumPy calls
+        points = corners.reshape(4, 2).tolist()
+
+        # Sum and difference (y - x) of coordinates
+        s = [x + y for x, y in points]
+        diff = [y - x for x, y in points]
+
+        return np.array([
+            points[s.index(min(s))],        # Top-left has smallest sum
+            points[diff.index(min(diff))],  # Top-right has smallest difference
+            points[diff.index(max(diff))],  # Bottom-left has largest difference
+            points[s.index(max(s))],        # Bottom-right has largest sum
+        ], dtype=np.float32)
 
     def apply_perspective_transform(self, image: np.ndarray, corners: np.ndarray,
                                    width: int = 500, height: int = 700) -> np.ndarray:
@@ -160,7 +521,12 @@ class OCRProcessor:
         matrix = cv2.getPerspectiveTransform(ordered_corners, dst_points)
 
         # Apply transformation
-        warped = cv2.warpPerspective(image, matrix, (width, height))
+        if self._has_cuda:
+            gpu_image = cv2.cuda_GpuMat()
+            gpu_image.upload(image)
+            warped = cv2.cuda.warpPerspective(gpu_image, matrix, (width, height)).download()
+        else:
+            warped = cv2.warpPerspective(image, matrix, (width, height))
 
         return warped
 
@@ -174,7 +540,8 @@ class OCRProcessor:
 
         Returns:
             Tuple of (processed_image, was_transformed)
-            - processed_image: The transformed image (or original if transformation failed)
+            - processed_image: The transformed, contrast-normalized grayscale image
+              (or original if transformation failed)
             - was_transformed: True if perspective transformation was applied
         """
         try:
@@ -193,8 +560,14 @@ class OCRProcessor:
                 # Apply perspective transformation
                 transformed = self.apply_perspective_transform(image, corners, width, height)
 
+                # Even out glare and shadows so Tesseract sees uniform contrast
+                if transformed.ndim == 3:
+                    transformed = cv2.cvtColor(transformed, cv2.COLOR_BGR2GRAY)
+                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+                clahe.apply(transformed, dst=transformed)
+
                 if debug:
-                    print(f"[OCR] Applied perspective transformation ({width}x{height})")
+                    print(f"[OCR] Applied perspective transformation ({width}x{height}) + CLAHE")
 
                 return transformed, True
             else:
@@ -225,38 +598,221 @@ class OCRProcessor:
                 if was_transformed:
                     print("[OCR] ✓ Card straightened with perspective transformation")
 
-            # Convert to PIL Image if needed
+            # Identical preprocessed images (retries, re-scans of a still
+            # card) reuse the previous result instead of re-running Tesseract
+            cache_key = None
+            if use_preprocessing and isinstance(processed_image, np.ndarray):
+                processed_image = np.ascontiguousarray(processed_image)
+                digest = hashlib.md5(processed_image.data)
+                digest.update(str(processed_image.shape).encode())
+                cache_key = digest.hexdigest()
+                with self._ocr_cache_lock:
+                    if cache_key in self._ocr_cache:
+                        self._ocr_cache.move_to_end(cache_key)
+                        return self._ocr_cache[cache_key]
+
+            # tesserocr reads a grayscale uint8 buffer directly; pytesseract
+            # (and tesserocr for other layouts) needs PIL
+            ocr_image = processed_image
             if isinstance(processed_image, np.ndarray):
-                pil_image = Image.fromarray(processed_image)
-            else:
-                pil_image = processed_image
+                gray = self._to_gray_u8(processed_image) if self._tess_apis else None
+                ocr_image = gray if gray is not None else self._to_pil(processed_image)
+
+            # One automatic-segmentation pass is usually enough; fall back to
+            # the other PSM modes only when it finds little text
+            results = {OCR_PRIMARY_PSM: self._try_tesseract(ocr_image, OCR_PRIMARY_PSM)}
+            if len(results[OCR_PRIMARY_PSM]) < OCR_MIN_TEXT_LENGTH:
+                fallback_modes = [psm for psm in OCR_PSM_MODES if psm != OCR_PRIMARY_PSM]
+                if self._psm_pool is not None:
+                    futures = {psm: self._psm_pool.submit(self._try_tesseract, ocr_image, psm)
+                               for psm in fallback_modes}
+                    results.update({psm: future.result() for psm, future in futures.items()})
+                else:
+                    results.update({psm: self._try_tesseract(ocr_image, psm)
+                                    for psm in fallback_modes})
+
+            # Keep the longest result
+            best_text = max((results[psm] for psm in OCR_PSM_MODES if psm in results),
+                            key=len, default="")
+            if cache_key is not None:
+                with self._ocr_cache_lock:
+                    self._ocr_cache[cache_key] = best_text
+                    if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                        self._ocr_cache.popitem(last=False)
+            return best_text
+        except Exception as e:
+            print(f"Error extracting text: {e}")
+            return ""
 
-            # Try multiple PSM modes for better results
-            # PSM 6: Assume a single uniform block of text
-            # PSM 11: Sparse text. Find as much text as possible in no particular order
-            # PSM 3: Fully automatic page segmentation
+    def extract_text_batch(self, images: List[np.ndarray], use_preprocessing: bool = True) -> List[str]:
+        """
+        Extract text from several images, reusing the same Tesseract instance
 
-            best_text = ""
-            max_length = 0
+        Args:
+            images: Images as numpy arrays
+            use_preprocessing: If True, apply perspective transformation before OCR
+
+        Returns:
+            Extracted text for each image, in order
+        """
+        return [self.extract_text(image, use_preprocessing) for image in images]
 
-            for psm in [11, 6, 3]:
-                try:
-                    text = pytesseract.image_to_string(
-                        pil_image,
-                        config=f'--psm {psm} -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789- '
+    def extract_text_regions(self, images: List[np.ndarray]) -> List[str]:
+        """
+        OCR several regions of one card (name, HP, set number...) in parallel
+
+        Tesseract is CPU-bound, so regions are spread over worker processes,
+        each holding its own OCRProcessor. Regions are already cropped, so no
+        perspective correction is applied.
+
+        Args:
+            images: Region images as numpy arrays
+
+        Returns:
+            Extracted text for each region, in order
+        """
+        if len(images) > 1:
+            try:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=min(len(images), os.cpu_count() or 1),
+                        initializer=_init_ocr_worker
                     )
-                    # Keep the longest/best result
-                    if len(text.strip()) > max_length:
-                        best_text = text
-                        max_length = len(text.strip())
-                except:
-                    continue
-
-            return best_text.strip()
-        except Exception as e:
-            print(f"Error extracting text: {e}")
+                return list(self._pool.map(_ocr_worker_extract, images))
+            except Exception as e:
+                print(f"[OCR] Parallel region OCR failed ({e}), running sequentially")
+                self._shutdown_region_pool()
+
+        return self.extract_text_batch(images, use_preprocessing=False)
+
+    def _shutdown_region_pool(self):
+        """Stop the multi-region worker processes (recreated on next use)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def shutdown(self):
+        """Stop any OCR worker processes and threads"""
+        self._shutdown_region_pool()
+        if self._psm_pool is not None:
+            self._psm_pool.shutdown(wait=False, cancel_futures=True)
+            self._psm_pool = None
+
+    @staticmethod
+    def _to_gray_u8(image: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Get a contiguous single-channel uint8 copy/view of an image
+
+        OpenCV BGR frames are reduced to grayscale (Tesseract binarizes a
+        grayscale image anyway, and would read raw BGR bytes as RGB).
+
+        Args:
+            image: Image as numpy array
+
+        Returns:
+            2-D contiguous uint8 array, or None for other dtypes/layouts
+        """
+        if image.dtype != np.uint8:
+            return None
+        if image.ndim == 3 and image.shape[2] == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if image.ndim == 2:
+            return np.ascontiguousarray(image)
+        return None
+
+    @staticmethod
+    def _to_pil(image: np.ndarray) -> Image.Image:
+        """
+        Wrap a numpy image for pytesseract, sharing memory when possible
+
+        Grayscale uint8 frames (the usual output of preprocessing) are mapped
+        as mode 'L' without a copy. OpenCV BGR frames are reduced to grayscale
+        once here (Tesseract binarizes a grayscale image anyway), which is
+        cheaper than the padded RGB copy PIL would otherwise make.
+
+        Args:
+            image: Image as numpy array
+
+        Returns:
+            PIL image
+        """
+        gray = OCRProcessor._to_gray_u8(image)
+        if gray is not None:
+            return Image.frombuffer('L', (gray.shape[1], gray.shape[0]), gray, 'raw', 'L', 0, 1)
+        return Image.fromarray(image)
+
+    def _try_tesseract(self, image, psm: int) -> str:
+        """Run one Tesseract pass, returning stripped text or "" on failure"""
+        try:
+            return self._run_tesseract(image, psm).strip()
+        except Exception:
             return ""
 
+    def _run_tesseract(self, image, psm: int) -> str:
+        """
+        Run a single Tesseract pass over an image
+
+        Args:
+            image: Image to recognize (PIL image, or numpy array with tesserocr)
+            psm: Tesseract page segmentation mode
+
+        Returns:
+            Recognized text, one line per text line, without low-confidence words
+        """
+        if psm in self._tess_apis:
+            api, lock = self._tess_apis[psm]
+            words = []
+            level = tesserocr.RIL.WORD
+            # Only single-channel uint8 goes in as raw bytes; anything else
+            # goes through PIL so channel order and bit depth are read correctly
+            gray = self._to_gray_u8(image) if isinstance(image, np.ndarray) else None
+            with lock:
+                if gray is not None:
+                    height, width = gray.shape
+                    api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+                elif isinstance(image, np.ndarray):
+                    api.SetImage(self._to_pil(image))
+                else:
+                    api.SetImage(image)
+                api.Recognize()
+                iterator = api.GetIterator()
+                if iterator is not None:
+                    line = 0
+                    for word in tesserocr.iterate_level(iterator, level):
+                        try:
+                            words.append((line, word.GetUTF8Text(level), word.Confidence(level)))
+                        except RuntimeError:
+                            pass
+                        if word.IsAtFinalElement(tesserocr.RIL.TEXTLINE, level):
+                            line += 1
+            return self._join_confident_words(words)
+
+        data = pytesseract.image_to_data(
+            image,
+            config=f'--psm {psm} -c tessedit_char_whitelist={TESSERACT_WHITELIST}',
+            output_type=pytesseract.Output.DICT
+        )
+        lines = zip(data['block_num'], data['par_num'], data['line_num'])
+        return self._join_confident_words(zip(lines, data['text'], data['conf']))
+
+    @staticmethod
+    def _join_confident_words(words) -> str:
+        """
+        Rebuild text from Tesseract words, skipping low-confidence ones
+
+        Args:
+            words: Iterable of (line key, word, confidence)
+
+        Returns:
+            Words joined by spaces within a line and newlines between lines
+        """
+        lines = {}
+        for line, word, conf in words:
+            word = word.strip()
+            if word and float(conf) >= OCR_MIN_CONFIDENCE:
+                lines.setdefault(line, []).append(word)
+        return '\n'.join(' '.join(line_words) for line_words in lines.values())
+
     def extract_card_name(self, text: str) -> Optional[str]:
         """
         Extract the Pokemon card name from OCR text
@@ -267,54 +823,10 @@ class OCRProcessor:
         Returns:
             Card name or None if not found
         """
-        # Split text into lines
-        lines = text.strip().split('\n')
-
-        # Try multiple strategies to extract the card name
-        candidates = []
-
-        # Strategy 1: First meaningful line (most common)
-        for line in lines[:7]:  # Check first 7 lines
-            line = line.strip()
-            # Remove common OCR artifacts
-            cleaned = re.sub(r'[^a-zA-Z0-9\s\-\'\.]', '', line)
-            cleaned = cleaned.strip()
-
-            # Card name should be at least 2 characters (more lenient)
-            if len(cleaned) >= 2:
-                # Check if it's mostly alphabetic (card names)
-                alpha_ratio = sum(c.isalpha() for c in cleaned) / len(cleaned) if len(cleaned) > 0 else 0
-                if alpha_ratio > 0.4:  # Lower threshold - was 0.5
-                    candidates.append((cleaned, alpha_ratio, 1))  # (name, alpha_ratio, priority)
-
-        # Strategy 2: Longest alphabetic sequence
-        all_words = ' '.join(lines).split()
-        for word in all_words:
-            cleaned = re.sub(r'[^a-zA-Z0-9\s\-\']', '', word).strip()
-            if len(cleaned) >= 3:
-                alpha_ratio = sum(c.isalpha() for c in cleaned) / len(cleaned) if len(cleaned) > 0 else 0
-                if alpha_ratio > 0.6:
-                    candidates.append((cleaned, alpha_ratio, 2))
-
-        # Strategy 3: Look for capitalized words (Pokemon names are often capitalized)
-        for line in lines[:10]:
-            words = line.split()
-            for word in words:
-                if word and word[0].isupper() and len(word) >= 3:
-                    cleaned = re.sub(r'[^a-zA-Z0-9\-\']', '', word).strip()
-                    if len(cleaned) >= 3:
-                        alpha_ratio = sum(c.isalpha() for c in cleaned) / len(cleaned) if len(cleaned) > 0 else 0
-                        candidates.append((cleaned, alpha_ratio, 3))
-
-        # Return the best candidate (prioritize by priority, then alpha_ratio, then length)
-        if candidates:
-            # Sort by: priority (lower is better), then alpha_ratio (higher is better), then length
-            candidates.sort(key=lambda x: (x[2], -x[1], -len(x[0])))
-            best_name = candidates[0][0]
-            print(f"[OCR] Extracted card name: '{best_name}' (from {len(candidates)} candidates)")
-            return best_name
-
-        return None
+        name, num_candidates = _extract_card_name(text)
+        if name:
+            print(f"[OCR] Extracted card name: '{name}' (from {num_candidates} candidates)")
+        return name
 
     def extract_hp(self, text: str) -> Optional[str]:
         """
@@ -327,75 +839,75 @@ class OCRProcessor:
             HP value as string or None if not found
         """
         # Look for HP pattern: "HP" followed by digits
-        hp_pattern = r'HP\s*(\d+)'
-        match = re.search(hp_pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return None
+        return _extract_hp(text)
 
-    def extract_pokemon_info(self, text: str) -> Dict[str, Optional[str]]:
+    def extract_pokemon_info(self, text: str,
+                             fields: Tuple[str, ...] = ('name', 'hp', 'type', 'rarity')
+                             ) -> Dict[str, Optional[str]]:
         """
         Extract various Pokemon information from OCR text
 
         Args:
             text: OCR extracted text
+            fields: Which of 'name', 'hp', 'type', 'rarity' to extract
 
         Returns:
-            Dictionary with extracted information
+            Dictionary with extracted information for the requested fields
         """
-        info = {
-            'name': self.extract_card_name(text),
-            'hp': self.extract_hp(text),
-            'type': self.extract_type(text),
-            'rarity': self.extract_rarity(text),
-        }
+        info = {}
+        if 'name' in fields:
+            info['name'] = self.extract_card_name(text)
+        if 'hp' in fields:
+            info['hp'] = self.extract_hp(text)
+        if 'type' in fields or 'rarity' in fields:
+            keywords = self.scan_keywords(text, text.lower())
+            if 'type' in fields:
+                info['type'] = keywords['type']
+            if 'rarity' in fields:
+                info['rarity'] = keywords['rarity']
         return info
 
-    def extract_type(self, text: str) -> Optional[str]:
+    def scan_keywords(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Optional[str]]:
         """
-        Extract Pokemon type from OCR text
+        Find Pokemon type and rarity in a single pass over the OCR text
 
         Args:
             text: OCR extracted text
+            text_lower: Precomputed text.lower(), if the caller already has it
 
         Returns:
-            Pokemon type or None if not found
+            Dictionary with 'type' and 'rarity' (None if not found)
+        """
+        if text_lower is None:
+            text_lower = text.lower()
+        poke_type, rarity = _scan_keywords(text_lower)
+        return {'type': poke_type, 'rarity': rarity}
+
+    def extract_type(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
-        # Common Pokemon types
-        types = [
-            'Grass', 'Fire', 'Water', 'Lightning', 'Psychic',
-            'Fighting', 'Darkness', 'Metal', 'Dragon', 'Fairy',
-            'Colorless'
-        ]
+        Extract Pokemon type from OCR text
 
-        for poke_type in types:
-            if poke_type.lower() in text.lower():
-                return poke_type
+        Args:
+            text: OCR extracted text
+            text_lower: Precomputed text.lower(), if the caller already has it
 
-        return None
+        Returns:
+            Pokemon type or None if not found
+        """
+        return self.scan_keywords(text, text_lower)['type']
 
-    def extract_rarity(self, text: str) -> Optional[str]:
+    def extract_rarity(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """
         Extract card rarity from OCR text
 
         Args:
             text: OCR extracted text
+            text_lower: Precomputed text.lower(), if the caller already has it
 
         Returns:
             Rarity or None if not found
         """
-        # Common rarities
-        rarities = [
-            'Common', 'Uncommon', 'Rare', 'Rare Holo', 'Rare Ultra',
-            'Rare Secret', 'Promo', 'Amazing Rare', 'Rare Rainbow'
-        ]
-
-        text_lower = text.lower()
-        for rarity in rarities:
-            if rarity.lower() in text_lower:
-                return rarity
-
-        return None
+        return self.scan_keywords(text, text_lower)['rarity']
 
     def clean_text(self, text: str) -> str:
         """
@@ -408,27 +920,41 @@ class OCRProcessor:
             Cleaned text
         """
         # Remove multiple spaces
-        cleaned = re.sub(r'\s+', ' ', text)
+        cleaned = _WS_RE.sub(' ', text)
 
         # Remove special characters that are likely OCR errors
-        cleaned = re.sub(r'[|@#$%^&*()_+=\[\]{};:<>?/\\]', '', cleaned)
-
-        # Fix common OCR mistakes
-        replacements = {
-            '0': 'O',  # Zero to O in text
-            'l': 'I',  # lowercase L to uppercase I
-            '5': 'S',  # 5 to S in text (context dependent)
-        }
+        cleaned = _JUNK_RE.sub('', cleaned)
 
         return cleaned.strip()
 
-    def find_best_match(self, ocr_name: str, candidate_names: List[str]) -> Optional[str]:
+    def build_name_index(self, candidate_names: List[str]) -> Dict[str, str]:
+        """
+        Build a lowercase-name lookup for find_best_match's exact-match step
+
+        Args:
+            candidate_names: List of possible card names
+
+        Returns:
+            Dictionary mapping lowercased name to the first candidate with it
+        """
+        index = {}
+        for name in candidate_names:
+            index.setdefault(name.lower(), name)
+        return index
+
+    def find_best_match(self, ocr_name: str, candidate_names: List[str],
+                        candidates_lower: Optional[List[str]] = None,
+                        name_index: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         Find the best matching card name from candidates
 
         Args:
             ocr_name: Name extracted from OCR
             candidate_names: List of possible card names from API
+            candidates_lower: Lowercased candidate_names, for callers that match
+                many scans against the same long-lived list
+            name_index: Result of build_name_index(candidate_names), for the
+                same kind of caller
 
         Returns:
             Best matching name or None
@@ -438,24 +964,53 @@ class OCRProcessor:
 
         ocr_lower = ocr_name.lower().strip()
 
-        # Exact match
-        for name in candidate_names:
-            if name.lower() == ocr_lower:
-                return name
+        # Exact match (a single dict lookup when an index was prebuilt)
+        if name_index is not None and ocr_lower in name_index:
+            return name_index[ocr_lower]
+
+        if candidates_lower is None:
+            candidates_lower = [name.lower() for name in candidate_names]
+
+        if name_index is None:
+            for name, name_lower in zip(candidate_names, candidates_lower):
+                if name_lower == ocr_lower:
+                    return name
+
+        if fuzz_process is not None:
+            # InDel (insert/delete only) suits OCR noise like "Piicachu" or
+            # "Char zard", and is bit-parallel for names up to 64 chars
+            match = fuzz_process.extractOne(
+                ocr_lower, candidates_lower, scorer=Indel.normalized_similarity,
+                processor=fuzz_utils.default_process, score_cutoff=0.6
+            )
+            return candidate_names[match[2]] if match else None
 
         # Partial match (OCR name in candidate)
-        for name in candidate_names:
-            if ocr_lower in name.lower() or name.lower() in ocr_lower:
+        for name, name_lower in zip(candidate_names, candidates_lower):
+            if ocr_lower in name_lower or name_lower in ocr_lower:
                 return name
 
+        # Fuzzy match - closest name within a small edit distance
+        k = max(2, len(ocr_lower) // 4)
+        best_match = None
+        best_dist = k + 1
+        for name, name_lower in zip(candidate_names, candidates_lower):
+            if abs(len(name_lower) - len(ocr_lower)) >= best_dist:
+                continue
+            dist = _bounded_lev(ocr_lower, name_lower, best_dist - 1)
+            if dist < best_dist:
+                best_dist = dist
+                best_match = name
+        if best_match is not None:
+            return best_match
+
         # Fuzzy match - check word overlap
         ocr_words = set(ocr_lower.split())
         best_match = None
         best_score = 0
 
-        for name in candidate_names:
-            name_words = set(name.lower().split())
-            common_words = ocr_words & name_words
+        for name, name_lower in zip(candidate_names, candidates_lower):
+            common_words = ocr_words & set(name_lower.split())
             score = len(common_words)
 
             if score > best_score:
@@ -483,9 +1038,26 @@ class OCRProcessor:
         }
 
         # Look for card number pattern (e.g., "25/102")
-        number_pattern = r'(\d+)\s*/\s*(\d+)'
-        match = re.search(number_pattern, text)
+        match = _SETNUM_RE.search(text)
         if match:
             info['set_number'] = f"{match.group(1)}/{match.group(2)}"
 
         return info
+
+
+# Per-process OCRProcessor used by extract_text_regions workers
+_worker_ocr = None
+
+
+def _init_ocr_worker():
+    """Create the OCR worker process's persistent OCRProcessor"""
+    global _worker_ocr
+    _worker_ocr = OCRProcessor()
+    # Regions already run one per process; PSM fallback threads would only
+    # oversubscribe the CPUs, so the worker runs its fallback passes in turn
+    _worker_ocr.shutdown()
+
+
+def _ocr_worker_extract(image: np.ndarray) -> str:
+    """OCR one pre-cropped region inside a worker process"""
+    return _worker_ocr.extract_text(image, use_preprocessing=False)
@@ -4,23 +4,81 @@ Handles all interactions with the Pokemon TCG API
 """
 
 import os
+import json
 import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any
 from pokemontcgsdk import Card, RestClient
+from dacite import from_dict  # same Card builder the SDK's QueryBuilder uses
 from dotenv import load_dotenv
 
+API_BASE_URL = "https://api.pokemontcg.io/v2"
+
+# Card search response cache (in memory, backed by JSON files on disk)
+API_CACHE_DIR = os.path.join("card_data", "api_cache")
+API_CACHE_SIZE = 256
+API_CACHE_TTL = 3600  # seconds
+API_CACHE_MAX_BYTES = 20 * 1024 * 1024
+API_CACHE_TRIM_INTERVAL = 64  # disk writes between size checks
+
+# Concurrent name searches; keep within the API's concurrent-request limit
+SEARCH_WORKERS = 8
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a pooled HTTP session that retries transient server errors
+
+    The pool is sized for the parallel cache-build and image-download
+    workers so concurrent requests don't wait on (or discard) connections.
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                  allowed_methods=['GET'])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry)
+
+    session = requests.Session()
+    session.headers['User-Agent'] = 'PokemonCardScanner/1.0'
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class TCGAPIClient:
     """Client for interacting with the Pokemon TCG API"""
 
-    def __init__(self):
-        """Initialize the API client with optional API key"""
+    def __init__(self, session: Optional[requests.Session] = None,
+                 cache_dir: Optional[str] = API_CACHE_DIR):
+        """
+        Initialize the API client with optional API key
+
+        Args:
+            session: Optional shared HTTP session (a pooled one is created if omitted)
+            cache_dir: Directory for cached search responses (None = memory only)
+        """
         load_dotenv()
         api_key = os.getenv('POKEMONTCG_IO_API_KEY')
 
+        # Pooled session for direct REST calls (keep-alive across requests/threads)
+        self.session = session if session is not None else create_http_session()
+
+        # Recent card search responses, keyed by query parameters
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self.cache_dir = cache_dir  # created on the first write
+        self._cache_writes = 0
+
         if api_key:
             RestClient.configure(api_key)
+            self.session.headers['X-Api-Key'] = api_key
             print("✓ API key configured")
         else:
             print("⚠ No API key found. Using default rate limits.")
@@ -40,8 +98,8 @@ class TCGAPIClient:
         """
         try:
             print("Checking Pokemon TCG API health...", end=" ")
-            response = requests.get(
-                "https://api.pokemontcg.io/v2/cards",
+            response = self.session.get(
+                f"{API_BASE_URL}/cards",
                 params={"pageSize": "1"},
                 timeout=timeout
             )
@@ -62,100 +120,258 @@ class TCGAPIClient:
             print(f"✗ API health check failed: {e}")
             return False
 
-    def search_card_by_name(self, card_name: str, set_name: Optional[str] = None, max_retries: int = 3) -> List[Card]:
+    def search_card_by_name(self, card_name: str, set_name: Optional[str] = None) -> List[Card]:
         """
         Search for cards by name and optionally by set
 
         Args:
             card_name: Name of the Pokemon card
             set_name: Optional set name to narrow search
-            max_retries: Maximum number of retries on timeout (default: 3)
 
         Returns:
             List of matching Card objects
         """
-        query = f'name:"{card_name}"'
+        # The API matches names case-insensitively, so normalise them here and
+        # "Pikachu", "pikachu " etc. share one query (and one cache entry)
+        query = f'name:"{card_name.strip().lower()}"'
         if set_name:
-            query += f' set.name:"{set_name}"'
+            query += f' set.name:"{set_name.strip().lower()}"'
 
-        for attempt in range(max_retries):
-            try:
-                print(f"Searching API with query: {query} (attempt {attempt + 1}/{max_retries})")
-                cards = Card.where(q=query)
-                print(f"API returned response, converting to list...")
-
-                # Convert to list to handle SDK response properly
-                cards_list = list(cards) if cards else []
-                print(f"Found {len(cards_list)} cards")
-                return cards_list
-            except Exception as e:
-                # Better error handling for bytes/string errors
-                try:
-                    error_msg = str(e)
-                except:
-                    error_msg = repr(e)
-
-                # Check if it's a timeout or server error
-                is_timeout = '504' in error_msg or 'timeout' in error_msg.lower()
-
-                if is_timeout and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"API timeout. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    print(f"Error searching for card: {error_msg}")
-                    import traceback
-                    traceback.print_exc()
-                    return []
-
-        return []
+        try:
+            print(f"Searching API with query: {query}")
+            cards_list = self._query_cards({'q': query})
+            print(f"Found {len(cards_list)} cards")
+            return cards_list
+        except Exception as e:
+            print(f"Error searching for card: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
 
-    def search_card_fuzzy(self, card_name: str, max_retries: int = 3) -> List[Card]:
+    def search_card_fuzzy(self, card_name: str) -> List[Card]:
         """
         Fuzzy search for cards (partial name matching)
 
         Args:
             card_name: Partial or full name of the Pokemon card
-            max_retries: Maximum number of retries on timeout (default: 3)
 
         Returns:
             List of matching Card objects
         """
-        query = f'name:{card_name}*'
+        query = f'name:{card_name.strip().lower()}*'
+
+        try:
+            print(f"Fuzzy searching API with query: {query}")
+            cards_list = self._query_cards({'q': query, 'pageSize': 20})
+            print(f"Found {len(cards_list)} cards")
+            return cards_list
+        except Exception as e:
+            print(f"Error in fuzzy search: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    def search_many(self, names: List[str]) -> Dict[str, List[Card]]:
+        """
+        Search for several card names at once
+
+        Each search spends most of its time waiting on the network, so the
+        lookups run concurrently on a small thread pool.
+
+        Args:
+            names: Card names to search for (duplicates are searched once)
+
+        Returns:
+            Dictionary mapping each name to its list of matching Card objects
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        workers = min(SEARCH_WORKERS, len(unique_names))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tcg-search') as pool:
+            results = pool.map(self.search_card_by_name, unique_names)
+            return dict(zip(unique_names, results))
+
+    def _query_cards(self, params: Dict[str, Any], timeout: int = 30) -> List[Card]:
+        """
+        Run an SDK-style card query over the pooled session
+
+        Pages through every result like Card.where(), but over keep-alive
+        connections with the session's retry policy (the SDK opens a new
+        urllib connection per page), and stops once totalCount cards are
+        fetched instead of requesting a trailing empty page. Responses are
+        cached (memory + disk) for API_CACHE_TTL, so repeat searches skip the
+        network entirely.
+
+        Args:
+            params: Query parameters ('q', optionally 'pageSize')
+            timeout: Request timeout in seconds
+
+        Returns:
+            List of Card objects
+        """
+        cache_key = json.dumps(params, sort_keys=True)
+        items = self._get_cached_response(cache_key)
+        if items is None:
+            params = dict(params, page=1)
+            items = []
+            while True:
+                response = self.session.get(f"{API_BASE_URL}/cards", params=params, timeout=timeout)
+                response.raise_for_status()
+                payload = response.json()
+                data = payload.get('data', [])
+                items.extend(Card.transform(item) for item in data)
+
+                if not data or len(items) >= payload.get('totalCount', 0):
+                    break
+                params['page'] += 1
+            self._store_cached_response(cache_key, items)
+
+        return [from_dict(Card, item) for item in items]
+
+    def _get_cached_response(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up a card search response in memory, then on disk
+
+        Args:
+            key: Serialized query parameters
+
+        Returns:
+            List of card dictionaries, or None on miss/expiry
+        """
+        now = time.time()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                stamp, items = entry
+                if now - stamp <= API_CACHE_TTL:
+                    self._response_cache.move_to_end(key)
+                    return items
+                del self._response_cache[key]
+
+        if not self.cache_dir:
+            return None
 
-        for attempt in range(max_retries):
+        path = self._response_cache_path(key)
+        try:
+            stamp = os.path.getmtime(path)
+            if now - stamp > API_CACHE_TTL:
+                os.remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        self._remember_response(key, stamp, items)
+        return items
+
+    def _store_cached_response(self, key: str, items: List[Dict[str, Any]]):
+        """
+        Store a card search response in memory and on disk
+
+        Args:
+            key: Serialized query parameters
+            items: List of card dictionaries returned by the API
+        """
+        self._remember_response(key, time.time(), items)
+        if not self.cache_dir:
+            return
+
+        # Trim on the first write and then every API_CACHE_TRIM_INTERVAL writes
+        with self._response_cache_lock:
+            trim = self._cache_writes % API_CACHE_TRIM_INTERVAL == 0
+            self._cache_writes += 1
+        if trim:
+            self._trim_response_cache()
+
+        # Write to a temporary file and rename, so readers never see a partial entry
+        path = self._response_cache_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(items, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write API cache: {e}")
             try:
-                print(f"Fuzzy searching API with query: {query} (attempt {attempt + 1}/{max_retries})")
-                cards = Card.where(q=query, pageSize=20)
-                print(f"API returned response, converting to list...")
-
-                # Convert to list to handle SDK response properly
-                cards_list = list(cards) if cards else []
-                print(f"Found {len(cards_list)} cards")
-                return cards_list
-            except Exception as e:
-                # Better error handling for bytes/string errors
-                try:
-                    error_msg = str(e)
-                except:
-                    error_msg = repr(e)
-
-                # Check if it's a timeout or server error
-                is_timeout = '504' in error_msg or 'timeout' in error_msg.lower() or '400' in error_msg
-
-                if is_timeout and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(f"API error. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _trim_response_cache(self):
+        """Delete expired cached responses, then the oldest until the cache fits its size limit"""
+        try:
+            now = time.time()
+            entries = []
+            total_size = 0
+            for entry in os.scandir(self.cache_dir):
+                if not entry.is_file():
                     continue
-                else:
-                    print(f"Error in fuzzy search: {error_msg}")
-                    import traceback
-                    traceback.print_exc()
-                    return []
+                stat = entry.stat()
+                if now - stat.st_mtime > API_CACHE_TTL:
+                    # Expired response, or a leftover from an interrupted write
+                    os.remove(entry.path)
+                elif entry.name.endswith('.json'):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+
+            if total_size <= API_CACHE_MAX_BYTES:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= API_CACHE_MAX_BYTES:
+                    break
+                os.remove(path)
+                total_size -= size
+        except FileNotFoundError:
+            pass  # Nothing cached yet (or an entry vanished under us)
+        except OSError as e:
+            print(f"Error trimming API cache: {e}")
+
+    def _remember_response(self, key: str, stamp: float, items: List[Dict[str, Any]]):
+        """Add a response to the in-memory LRU, evicting the oldest if full"""
+        with self._response_cache_lock:
+            self._response_cache[key] = (stamp, items)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > API_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _response_cache_path(self, key: str) -> str:
+        """Disk cache file for a serialized query"""
+        return os.path.join(self.cache_dir, hashlib.md5(key.encode('utf-8')).hexdigest() + ".json")
+
+    def search_cards(self, query: str, page: int = 1, page_size: int = 250,
+                     timeout: int = 30) -> Optional[Dict[str, Any]]:
+        """
+        Search cards through the REST API directly, returning the raw JSON
+
+        Unlike the SDK searches this fetches a single page and skips building
+        Card objects, which makes it cheap for bulk and concurrent lookups.
+
+        Args:
+            query: Lucene-style query (e.g. 'name:"Pikachu"'), or "" for all cards
+            page: Page number (1-based)
+            page_size: Number of cards per page (max 250)
+            timeout: Request timeout in seconds
 
-        return []
+        Returns:
+            Response dictionary with a 'data' list of card dictionaries, or None on error
+        """
+        params = {'page': page, 'pageSize': page_size}
+        if query:
+            params['q'] = query
+
+        try:
+            response = self.session.get(f"{API_BASE_URL}/cards", params=params, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            print(f"Error searching cards ({query!r}, page {page}): {e}")
+            return None
 
     def get_card_by_id(self, card_id: str) -> Optional[Card]:
         """
@@ -168,8 +384,9 @@ class TCGAPIClient:
             Card object or None if not found
         """
         try:
-            card = Card.find(card_id)
-            return card
+            response = self.session.get(f"{API_BASE_URL}/cards/{card_id}", timeout=30)
+            response.raise_for_status()
+            return from_dict(Card, Card.transform(response.json()['data']))
         except Exception as e:
             print(f"Error getting card by ID: {e}")
             return None
@@ -184,40 +401,43 @@ class TCGAPIClient:
         Returns:
             Dictionary with all card information
         """
+        card_set = getattr(card, 'set', None)
+        images = getattr(card, 'images', None)
         info = {
             'id': card.id,
             'name': card.name,
             'supertype': card.supertype,
-            'subtypes': card.subtypes if hasattr(card, 'subtypes') else [],
-            'hp': card.hp if hasattr(card, 'hp') else None,
-            'types': card.types if hasattr(card, 'types') else [],
-            'evolves_from': card.evolvesFrom if hasattr(card, 'evolvesFrom') else None,
+            'subtypes': getattr(card, 'subtypes', []),
+            'hp': getattr(card, 'hp', None),
+            'types': getattr(card, 'types', []),
+            'evolves_from': getattr(card, 'evolvesFrom', None),
             'abilities': [],
             'attacks': [],
             'weaknesses': [],
             'resistances': [],
-            'retreat_cost': card.retreatCost if hasattr(card, 'retreatCost') else [],
-            'number': card.number if hasattr(card, 'number') else None,
-            'artist': card.artist if hasattr(card, 'artist') else None,
-            'rarity': card.rarity if hasattr(card, 'rarity') else None,
-            'flavor_text': card.flavorText if hasattr(card, 'flavorText') else None,
+            'retreat_cost': getattr(card, 'retreatCost', []),
+            'number': getattr(card, 'number', None),
+            'artist': getattr(card, 'artist', None),
+            'rarity': getattr(card, 'rarity', None),
+            'flavor_text': getattr(card, 'flavorText', None),
             'set': {
-                'name': card.set.name if hasattr(card, 'set') else None,
-                'series': card.set.series if hasattr(card, 'set') else None,
-                'release_date': card.set.releaseDate if hasattr(card, 'set') else None,
+                'name': getattr(card_set, 'name', None),
+                'series': getattr(card_set, 'series', None),
+                'release_date': getattr(card_set, 'releaseDate', None),
             },
             'images': {
-                'small': card.images.small if hasattr(card, 'images') else None,
-                'large': card.images.large if hasattr(card, 'images') else None,
+                'small': getattr(images, 'small', None),
+                'large': getattr(images, 'large', None),
             },
             'pricing': self._extract_pricing(card),
             'legalities': {},
-            'regulation_mark': card.regulationMark if hasattr(card, 'regulationMark') else None,
+            'regulation_mark': getattr(card, 'regulationMark', None),
         }
 
         # Extract abilities
-        if hasattr(card, 'abilities') and card.abilities:
-            for ability in card.abilities:
+        abilities = getattr(card, 'abilities', None)
+        if abilities:
+            for ability in abilities:
                 info['abilities'].append({
                     'name': ability.name,
                     'text': ability.text,
@@ -225,26 +445,29 @@ class TCGAPIClient:
                 })
 
         # Extract attacks
-        if hasattr(card, 'attacks') and card.attacks:
-            for attack in card.attacks:
+        attacks = getattr(card, 'attacks', None)
+        if attacks:
+            for attack in attacks:
                 info['attacks'].append({
                     'name': attack.name,
-                    'cost': attack.cost if hasattr(attack, 'cost') else [],
-                    'damage': attack.damage if hasattr(attack, 'damage') else None,
-                    'text': attack.text if hasattr(attack, 'text') else None,
+                    'cost': getattr(attack, 'cost', []),
+                    'damage': getattr(attack, 'damage', None),
+                    'text': getattr(attack, 'text', None),
                 })
 
         # Extract weaknesses
-        if hasattr(card, 'weaknesses') and card.weaknesses:
-            for weakness in card.weaknesses:
+        weaknesses = getattr(card, 'weaknesses', None)
+        if weaknesses:
+            for weakness in weaknesses:
                 info['weaknesses'].append({
                     'type': weakness.type,
                     'value': weakness.value,
                 })
 
         # Extract resistances
-        if hasattr(card, 'resistances') and card.resistances:
-            for resistance in card.resistances:
+        resistances = getattr(card, 'resistances', None)
+        if resistances:
+            for resistance in resistances:
                 info['resistances'].append({
                     'type': resistance.type,
                     'value': resistance.value,
@@ -252,14 +475,28 @@ class TCGAPIClient:
 
         # Extract legalities
         if hasattr(card, 'legalities'):
+            legalities = card.legalities
             info['legalities'] = {
-                'standard': card.legalities.standard if hasattr(card.legalities, 'standard') else None,
-                'expanded': card.legalities.expanded if hasattr(card.legalities, 'expanded') else None,
-                'unlimited': card.legalities.unlimited if hasattr(card.legalities, 'unlimited') else None,
+                'standard': getattr(legalities, 'standard', None),
+                'expanded': getattr(legalities, 'expanded', None),
+                'unlimited': getattr(legalities, 'unlimited', None),
             }
 
         return info
 
+    def extract_many(self, cards: List[Card]) -> List[Dict[str, Any]]:
+        """
+        Extract information from several cards in one pass
+
+        Args:
+            cards: Card objects from the API
+
+        Returns:
+            List of card information dictionaries, in the same order
+        """
+        extract = self.extract_card_info
+        return [extract(card) for card in cards]
+
     def _extract_pricing(self, card: Card) -> Dict[str, Any]:
         """
         Extract pricing information from a card
@@ -276,46 +513,43 @@ class TCGAPIClient:
         }
 
         # TCGPlayer pricing (USD)
-        if hasattr(card, 'tcgplayer') and card.tcgplayer:
-            tcg = card.tcgplayer
+        tcg = getattr(card, 'tcgplayer', None)
+        if tcg:
             pricing['tcgplayer'] = {
-                'url': tcg.url if hasattr(tcg, 'url') else None,
-                'updated_at': tcg.updatedAt if hasattr(tcg, 'updatedAt') else None,
+                'url': getattr(tcg, 'url', None),
+                'updated_at': getattr(tcg, 'updatedAt', None),
                 'prices': {}
             }
 
-            if hasattr(tcg, 'prices') and tcg.prices:
-                if hasattr(tcg.prices, 'normal'):
-                    pricing['tcgplayer']['prices']['normal'] = {
-                        'low': tcg.prices.normal.low if hasattr(tcg.prices.normal, 'low') else None,
-                        'mid': tcg.prices.normal.mid if hasattr(tcg.prices.normal, 'mid') else None,
-                        'high': tcg.prices.normal.high if hasattr(tcg.prices.normal, 'high') else None,
-                        'market': tcg.prices.normal.market if hasattr(tcg.prices.normal, 'market') else None,
-                    }
-                if hasattr(tcg.prices, 'holofoil'):
-                    pricing['tcgplayer']['prices']['holofoil'] = {
-                        'low': tcg.prices.holofoil.low if hasattr(tcg.prices.holofoil, 'low') else None,
-                        'mid': tcg.prices.holofoil.mid if hasattr(tcg.prices.holofoil, 'mid') else None,
-                        'high': tcg.prices.holofoil.high if hasattr(tcg.prices.holofoil, 'high') else None,
-                        'market': tcg.prices.holofoil.market if hasattr(tcg.prices.holofoil, 'market') else None,
-                    }
+            prices = getattr(tcg, 'prices', None)
+            if prices:
+                for variant in ('normal', 'holofoil'):
+                    if hasattr(prices, variant):
+                        variant_prices = getattr(prices, variant)
+                        pricing['tcgplayer']['prices'][variant] = {
+                            'low': getattr(variant_prices, 'low', None),
+                            'mid': getattr(variant_prices, 'mid', None),
+                            'high': getattr(variant_prices, 'high', None),
+                            'market': getattr(variant_prices, 'market', None),
+                        }
 
         # Cardmarket pricing (EUR)
-        if hasattr(card, 'cardmarket') and card.cardmarket:
-            cm = card.cardmarket
+        cm = getattr(card, 'cardmarket', None)
+        if cm:
             pricing['cardmarket'] = {
-                'url': cm.url if hasattr(cm, 'url') else None,
-                'updated_at': cm.updatedAt if hasattr(cm, 'updatedAt') else None,
+                'url': getattr(cm, 'url', None),
+                'updated_at': getattr(cm, 'updatedAt', None),
                 'prices': {}
             }
 
             if hasattr(cm, 'prices'):
+                cm_prices = cm.prices
                 pricing['cardmarket']['prices'] = {
-                    'average_sell_price': cm.prices.averageSellPrice if hasattr(cm.prices, 'averageSellPrice') else None,
-                    'low_price': cm.prices.lowPrice if hasattr(cm.prices, 'lowPrice') else None,
-                    'trend_price': cm.prices.trendPrice if hasattr(cm.prices, 'trendPrice') else None,
-                    'german_pro_low': cm.prices.germanProLow if hasattr(cm.prices, 'germanProLow') else None,
-                    'suggested_price': cm.prices.suggestedPrice if hasattr(cm.prices, 'suggestedPrice') else None,
+                    'average_sell_price': getattr(cm_prices, 'averageSellPrice', None),
+                    'low_price': getattr(cm_prices, 'lowPrice', None),
+                    'trend_price': getattr(cm_prices, 'trendPrice', None),
+                    'german_pro_low': getattr(cm_prices, 'germanProLow', None),
+                    'suggested_price': getattr(cm_prices, 'suggestedPrice', None),
                 }
 
         return pricing
@@ -5,15 +5,47 @@ Shows captured card details and allows user to verify/correct before searching
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-import cv2
 import numpy as np
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+# OCR text up to this size is shown in a plain label instead of a Text widget
+OCR_LABEL_MAX_CHARS = 500
+OCR_LABEL_MAX_LINES = 6  # matches the Text widget's height
+
+# Screen size, looked up on first use (it doesn't change while the app runs)
+_screen_size: Optional[Tuple[int, int]] = None
+
+
+def _get_screen_size(widget) -> Tuple[int, int]:
+    """
+    Get the screen size, querying Tk only the first time
+
+    Args:
+        widget: Any Tk widget on the screen
+
+    Returns:
+        Tuple of (width, height) in pixels
+    """
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return _screen_size
 
 
 class VerificationDialog:
     """Dialog for verifying captured card information before searching"""
 
+    # Fonts shared by the dialog's widgets
+    TITLE_FONT = ('Arial', 14, 'bold')
+    HEADING_FONT = ('Arial', 10, 'bold')
+    NAME_FONT = ('Arial', 11)
+    LABEL_FONT = ('Arial', 9, 'bold')
+    BODY_FONT = ('Arial', 9)
+    MONO_FONT = ('Courier', 9)
+
     def __init__(self, parent, image: np.ndarray, ocr_text: str,
                  ocr_card_name: Optional[str],
                  image_match: Optional[Dict],
@@ -38,25 +70,28 @@ class VerificationDialog:
         self.ocr_text = ocr_text
         self.ocr_card_name = ocr_card_name
         self.image_match = image_match
+        self.match_confidence = image_match.get('confidence', 0) if image_match else 0
         self.on_confirm = on_confirm
         self.on_correct = on_correct
         self.on_retry = on_retry
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()  # Keep hidden until every widget is packed
         self.dialog.title("Verify Card Detection")
         self.dialog.geometry("900x700")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
 
         # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (900 // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (700 // 2)
+        screen_width, screen_height = _get_screen_size(self.dialog)
+        x = (screen_width // 2) - (900 // 2)
+        y = (screen_height // 2) - (700 // 2)
         self.dialog.geometry(f"+{x}+{y}")
 
-        # Build UI
+        # Build UI, then map the finished window in one layout pass
         self._build_ui()
+        self.dialog.deiconify()
+        self.dialog.grab_set()
 
     def _build_ui(self):
         """Build the verification dialog UI"""
@@ -66,7 +101,7 @@ class VerificationDialog:
 
         # Title
         title_label = ttk.Label(main_frame, text="Card Detection Results",
-                               font=('Arial', 14, 'bold'))
+                               font=self.TITLE_FONT)
         title_label.pack(pady=(0, 10))
 
         # Content area (horizontal split)
@@ -80,8 +115,9 @@ class VerificationDialog:
         self.image_canvas = tk.Canvas(left_frame, width=400, height=500, bg='white')
         self.image_canvas.pack()
 
-        # Display captured image
-        self._display_image()
+        # Display captured image once the dialog has been drawn, so building
+        # the preview doesn't hold up the window appearing
+        self.dialog.after_idle(self._display_image)
 
         # Right side - Detection results
         right_frame = ttk.Frame(content_frame)
@@ -91,29 +127,25 @@ class VerificationDialog:
         ocr_frame = ttk.LabelFrame(right_frame, text="OCR Detection", padding="10")
         ocr_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-        ttk.Label(ocr_frame, text="Detected Card Name:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
+        ttk.Label(ocr_frame, text="Detected Card Name:", font=self.HEADING_FONT).pack(anchor=tk.W)
 
         self.ocr_name_label = ttk.Label(ocr_frame, text=self.ocr_card_name or "❌ No card name detected",
-                                       font=('Arial', 11),
+                                       font=self.NAME_FONT,
                                        foreground='green' if self.ocr_card_name else 'red')
         self.ocr_name_label.pack(anchor=tk.W, pady=(5, 10))
 
-        ttk.Label(ocr_frame, text="Full OCR Text:", font=('Arial', 9, 'bold')).pack(anchor=tk.W)
-
-        ocr_text_frame = ttk.Frame(ocr_frame)
-        ocr_text_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
-
-        ocr_scrollbar = ttk.Scrollbar(ocr_text_frame)
-        ocr_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.ocr_text_widget = tk.Text(ocr_text_frame, height=6, wrap=tk.WORD,
-                                       yscrollcommand=ocr_scrollbar.set,
-                                       font=('Courier', 9))
-        self.ocr_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ocr_scrollbar.config(command=self.ocr_text_widget.yview)
+        ttk.Label(ocr_frame, text="Full OCR Text:", font=self.LABEL_FONT).pack(anchor=tk.W)
 
-        self.ocr_text_widget.insert('1.0', self.ocr_text or "No text extracted")
-        self.ocr_text_widget.config(state=tk.DISABLED)
+        ocr_text = self.ocr_text or "No text extracted"
+        if len(ocr_text) <= OCR_LABEL_MAX_CHARS and ocr_text.count('\n') < OCR_LABEL_MAX_LINES:
+            # Short text fits in a label; no need for a scrollable Text widget
+            ttk.Label(ocr_frame, text=ocr_text, font=self.MONO_FONT,
+                      wraplength=350, justify=tk.LEFT).pack(anchor=tk.W, pady=(5, 0))
+        else:
+            # Long text goes in a scrollable Text widget, built only on request
+            self.ocr_show_button = ttk.Button(ocr_frame, text="Show full OCR text ▸",
+                                              command=lambda: self._show_ocr_full(ocr_frame))
+            self.ocr_show_button.pack(anchor=tk.W, pady=(5, 0))
 
         # Image Match Results section
         match_frame = ttk.LabelFrame(right_frame, text="Image Hash Match", padding="10")
@@ -121,29 +153,30 @@ class VerificationDialog:
 
         if self.image_match:
             # Match found
-            ttk.Label(match_frame, text="✓ Match Found!", font=('Arial', 10, 'bold'),
+            ttk.Label(match_frame, text="✓ Match Found!", font=self.HEADING_FONT,
                      foreground='green').pack(anchor=tk.W)
 
-            info_text = f"""
-Card Name: {self.image_match.get('name', 'Unknown')}
-Set: {self.image_match.get('set_name', 'Unknown')}
-Number: {self.image_match.get('number', 'Unknown')}
-Rarity: {self.image_match.get('rarity', 'Unknown')}
-
-Confidence: {self.image_match.get('confidence', 0):.1f}%
-Hash Distance: {self.image_match.get('distance', 0)}
-            """.strip()
-
-            match_info = ttk.Label(match_frame, text=info_text, font=('Arial', 9),
+            match = self.image_match
+            info_text = "\n".join((
+                f"Card Name: {match.get('name', 'Unknown')}",
+                f"Set: {match.get('set_name', 'Unknown')}",
+                f"Number: {match.get('number', 'Unknown')}",
+                f"Rarity: {match.get('rarity', 'Unknown')}",
+                "",
+                f"Confidence: {self.match_confidence:.1f}%",
+                f"Hash Distance: {match.get('distance', 0)}",
+            ))
+
+            match_info = ttk.Label(match_frame, text=info_text, font=self.BODY_FONT,
                                   justify=tk.LEFT)
             match_info.pack(anchor=tk.W, pady=(5, 0))
         else:
             # No match
-            ttk.Label(match_frame, text="❌ No image match found", font=('Arial', 10, 'bold'),
+            ttk.Label(match_frame, text="❌ No image match found", font=self.HEADING_FONT,
                      foreground='red').pack(anchor=tk.W)
 
             ttk.Label(match_frame, text="Try downloading card images first\n(Learning > Download Card Images)",
-                     font=('Arial', 9), foreground='gray').pack(anchor=tk.W, pady=(5, 0))
+                     font=self.BODY_FONT, foreground='gray').pack(anchor=tk.W, pady=(5, 0))
 
         # Recommendation section
         recommendation_frame = ttk.Frame(right_frame)
@@ -151,11 +184,11 @@ Hash Distance: {self.image_match.get('distance', 0)}
 
         ttk.Separator(recommendation_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Label(recommendation_frame, text="Recommendation:", font=('Arial', 10, 'bold')).pack(anchor=tk.W)
+        ttk.Label(recommendation_frame, text="Recommendation:", font=self.HEADING_FONT).pack(anchor=tk.W)
 
         recommendation = self._get_recommendation()
         rec_label = ttk.Label(recommendation_frame, text=recommendation,
-                             font=('Arial', 9), wraplength=350)
+                             font=self.BODY_FONT, wraplength=350)
         rec_label.pack(anchor=tk.W, pady=(5, 0))
 
         # Action buttons
@@ -182,31 +215,41 @@ Hash Distance: {self.image_match.get('distance', 0)}
         self.dialog.bind('<Return>', lambda e: self._handle_confirm())
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
 
+    def _show_ocr_full(self, ocr_frame):
+        """
+        Replace the "Show full OCR text" button with the scrollable OCR text
+
+        Args:
+            ocr_frame: Frame of the OCR Detection section
+        """
+        self.ocr_show_button.destroy()
+
+        ocr_text_frame = ttk.Frame(ocr_frame)
+        ocr_text_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        ocr_scrollbar = ttk.Scrollbar(ocr_text_frame)
+        ocr_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.ocr_text_widget = tk.Text(ocr_text_frame, height=6, wrap=tk.WORD,
+                                       yscrollcommand=ocr_scrollbar.set,
+                                       font=self.MONO_FONT)
+        self.ocr_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        ocr_scrollbar.config(command=self.ocr_text_widget.yview)
+
+        self.ocr_text_widget.insert('1.0', self.ocr_text)
+        self.ocr_text_widget.config(state=tk.DISABLED)
+
     def _display_image(self):
         """Display the captured image in the canvas"""
         try:
-            # Convert BGR to RGB
-            if len(self.image.shape) == 3 and self.image.shape[2] == 3:
-                image_rgb = cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB)
-            else:
-                image_rgb = self.image
+            # The dialog may have been closed before this idle callback ran
+            if not self.image_canvas.winfo_exists():
+                return
 
-            # Convert to PIL Image
-            pil_image = Image.fromarray(image_rgb)
-
-            # Resize to fit canvas while maintaining aspect ratio
             canvas_width = 400
             canvas_height = 500
 
-            img_width, img_height = pil_image.size
-            ratio = min(canvas_width / img_width, canvas_height / img_height)
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-
-            pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Convert to PhotoImage and display
-            photo = ImageTk.PhotoImage(pil_image)
+            photo = self._render_photo(canvas_width, canvas_height)
             self.image_canvas.create_image(canvas_width // 2, canvas_height // 2,
                                           anchor=tk.CENTER, image=photo)
             self.image_canvas.image = photo  # Keep reference
@@ -214,12 +257,63 @@ Hash Distance: {self.image_match.get('distance', 0)}
         except Exception as e:
             print(f"[VerificationDialog] Error displaying image: {e}")
 
+    def _render_photo(self, canvas_width: int, canvas_height: int) -> "ImageTk.PhotoImage":
+        """
+        Convert the captured image into a PhotoImage that fits the canvas
+
+        Args:
+            canvas_width: Canvas width in pixels
+            canvas_height: Canvas height in pixels
+
+        Returns:
+            PhotoImage scaled to fit, keeping the aspect ratio
+        """
+        # PIL is only needed once a preview is drawn, so it isn't loaded with the module
+        from PIL import Image, ImageTk
+
+        # PIL only has a fast path for 8-bit data, so downcast other depths
+        # in one vectorized pass (floats are taken to be in 0..1)
+        image = self.image
+        if image.dtype == np.uint16:
+            image = (image >> 8).astype(np.uint8)
+        elif image.dtype.kind == 'f':
+            image = np.clip(image * 255, 0, 255).astype(np.uint8)
+        elif image.dtype != np.uint8:
+            image = np.clip(image, 0, 255).astype(np.uint8)
+
+        # Convert to PIL Image straight from the contiguous buffer; for colour
+        # captures the raw decoder reorders BGR to RGB as it reads
+        image = np.ascontiguousarray(image)
+        size = (image.shape[1], image.shape[0])
+        if image.ndim == 3 and image.shape[2] == 3:
+            pil_image = Image.frombuffer('RGB', size, image, 'raw', 'BGR', 0, 1)
+        elif image.ndim == 2:
+            pil_image = Image.frombuffer('L', size, image, 'raw', 'L', 0, 1)
+        else:
+            pil_image = Image.fromarray(image)
+
+        # Resize to fit canvas while maintaining aspect ratio
+        img_width, img_height = pil_image.size
+        ratio = min(canvas_width / img_width, canvas_height / img_height)
+
+        # Captures that already fit (e.g. pre-cropped) are shown as-is
+        if ratio < 1.0:
+            new_width = int(img_width * ratio)
+            new_height = int(img_height * ratio)
+
+            # reducing_gap box-reduces large captures by an integer factor first,
+            # so LANCZOS only filters the last (at most 2x) step
+            pil_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                                         reducing_gap=2.0)
+
+        return ImageTk.PhotoImage(pil_image)
+
     def _get_recommendation(self) -> str:
         """Get recommendation text based on detection results"""
-        if self.image_match and self.image_match.get('confidence', 0) > 80:
+        if self.match_confidence > 80:
             return "✓ High confidence match! Click 'Confirm & Search' to proceed."
 
-        elif self.image_match and self.image_match.get('confidence', 0) > 50:
+        elif self.match_confidence > 50:
             return "⚠ Moderate confidence match. Verify the card name is correct before confirming."
 
         elif self.ocr_card_name:
@@ -231,7 +325,7 @@ Hash Distance: {self.image_match.get('distance', 0)}
     def _handle_confirm(self):
         """Handle confirm button click"""
         # Determine which card name to use
-        if self.image_match and self.image_match.get('confidence', 0) > 50:
+        if self.match_confidence > 50:
             card_name = self.image_match.get('name')
             method = 'image_hash'
         elif self.ocr_card_name: